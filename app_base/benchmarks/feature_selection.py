@@ -0,0 +1,46 @@
+"""
+Forward selection with rank-one QR updates against refitting every candidate model.
+
+Run from app_base: python -m benchmarks.feature_selection [n_rows] [n_columns]
+"""
+import sys
+import time
+import numpy as np
+from services.feature_selection import select_features
+from services.linear_solvers import solve_least_squares
+
+N_STEPS = 10
+
+def refit_forward(X: np.ndarray, Y: np.ndarray, steps: int) -> list[int]:
+    """Forward selection by solving the least-squares problem of every candidate from scratch."""
+    selected = []
+    for _ in range(steps):
+        best, best_rss = None, np.inf
+        for column in range(X.shape[1]):
+            if column in selected:
+                continue
+            design = np.hstack((np.ones((len(X), 1)), X[:, selected + [column]]))
+            coefficients = solve_least_squares(design, Y).coefficients
+            rss = ((Y - design @ coefficients) ** 2).sum()
+            if rss < best_rss:
+                best, best_rss = column, rss
+        selected.append(best)
+    return selected
+
+def main(n_rows: int = 2000, n_columns: int = 300):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(n_rows, n_columns))
+    Y = X[:, :N_STEPS] @ rng.normal(size=(N_STEPS, 2)) + rng.normal(size=(n_rows, 2))
+
+    start = time.perf_counter()
+    selection = select_features(X, Y, 'forward', max_features=N_STEPS)
+    updated = time.perf_counter() - start
+    start = time.perf_counter()
+    reference = refit_forward(X, Y, N_STEPS)
+    refitted = time.perf_counter() - start
+    print(f"{n_rows} x {n_columns}, {N_STEPS} forward steps")
+    print(f"  QR updates  {updated:>8.3f} s")
+    print(f"  refit       {refitted:>8.3f} s   same columns: {sorted(selection.steps['column'][1:]) == sorted(reference)}")
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""
+Fit time of the batch forecasters on many long series.
+
+Run from app_base: python -m benchmarks.forecasting [n_series] [n_points]
+"""
+import sys
+import time
+import numpy as np
+from services.forecasting import AutoRegressive, HoltWinters
+
+PERIOD = 24
+
+def synthetic_series(n_points: int, n_series: int, seed: int = 0) -> np.ndarray:
+    """Trend + daily cycle + AR(1) noise, a different mix per series."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_points)[:, None]
+    slope = rng.normal(0, 0.01, n_series)
+    amplitude = rng.uniform(0.5, 3, n_series)
+    noise = rng.normal(size=(n_points, n_series))
+    for i in range(1, n_points):
+        noise[i] += 0.5 * noise[i - 1]
+    return 10 + slope * t + amplitude * np.sin(2 * np.pi * t / PERIOD) + noise
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:<40}{time.perf_counter() - start:>10.3f} s")
+    return result
+
+def main(n_series: int = 1000, n_points: int = 10_000):
+    data = timed(f"generate {n_series} series x {n_points} points", lambda: synthetic_series(n_points, n_series))
+    model = HoltWinters(period=PERIOD)
+    grid = len(model.alphas) * len(model.betas) * len(model.gammas)
+    holt_winters = timed(f"Holt-Winters fit ({grid} params/series)", lambda: model.fit(data))
+    timed("Holt-Winters forecast, 100 steps", lambda: holt_winters.forecast(100))
+    autoregressive = timed("AR fit (orders 0-10, AIC)", lambda: AutoRegressive().fit(data))
+    timed("AR forecast, 100 steps", lambda: autoregressive.forecast(100))
+
+    try:
+        from statsmodels.tsa.holtwinters import ExponentialSmoothing
+    except ImportError:
+        return
+    # Referência: statsmodels ajusta uma série por vez
+    sample = min(5, n_series)
+    start = time.perf_counter()
+    for column in range(sample):
+        ExponentialSmoothing(data[:, column], trend='add', seasonal='add', seasonal_periods=PERIOD).fit()
+    per_series = (time.perf_counter() - start) / sample
+    print(f"{'statsmodels Holt-Winters, extrapolated':<40}{per_series * n_series:>10.3f} s")
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
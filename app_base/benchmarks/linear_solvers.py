@@ -0,0 +1,42 @@
+"""
+Time and accuracy of the least-squares backends on tall, ill-conditioned and wide designs.
+
+Run from app_base: python -m benchmarks.linear_solvers [n_rows]
+"""
+import sys
+import time
+import numpy as np
+from services.linear_solvers import SOLVERS, solve_least_squares
+
+N_RESPONSES = 3
+
+def designs(n_rows: int, seed: int = 0) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    rng = np.random.default_rng(seed)
+    tall = rng.normal(size=(n_rows, 50))
+    # Duas colunas quase colineares: cond(X) ~ 1e8
+    ill = rng.normal(size=(n_rows // 10, 50))
+    ill[:, -1] = ill[:, 0] + 1e-8 * rng.normal(size=len(ill))
+    wide = rng.normal(size=(500, 2000))
+    return {f"tall {n_rows} x 50": tall, f"ill-conditioned {len(ill)} x 50": ill, "wide 500 x 2000": wide}
+
+def legacy_fit(X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+    """The previous MultipleLinearRegression.fit: pinv of the normal matrix."""
+    return np.linalg.pinv(X.T @ X) @ X.T @ Y
+
+def main(n_rows: int = 1_000_000):
+    rng = np.random.default_rng(1)
+    for name, X in designs(n_rows).items():
+        Y = X[:, :5] @ rng.normal(size=(5, N_RESPONSES)) + rng.normal(size=(len(X), N_RESPONSES))
+        print(name)
+        reference = None
+        backends = [(method, lambda method=method: solve_least_squares(X, Y, method).coefficients) for method in SOLVERS]
+        for label, fit in backends + [("legacy pinv(X^T X)", lambda: legacy_fit(X, Y))]:
+            start = time.perf_counter()
+            coefficients = fit()
+            elapsed = time.perf_counter() - start
+            residual = np.linalg.norm(X @ coefficients - Y)
+            reference = residual if reference is None else reference
+            print(f"  {label:<22}{elapsed:>9.3f} s   residual norm - auto: {residual - reference:+.2e}")
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
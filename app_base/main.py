@@ -6,22 +6,34 @@ import seaborn as sns
 from autoviz import AutoViz_Class
 import tempfile
 import os
-import re
-import io  # Adicionado para StringIO
 from services.time_series import TimeSeries
 from services.table_class import Table
 from services.multiple_linear_regression import MultipleLinearRegression
-from services.csv_parser import parse_to_csv
-
-def contains_link(series):
-    """Verifica se uma série contém links."""
-    url_pattern = r'(http|https|www)\S*'
-    return series.astype(str).apply(lambda x: bool(re.search(url_pattern, x)))
-
-def filter_columns_with_links(df):
-    """Remove colunas que contêm links."""
-    columns_with_links = [col for col in df.columns if contains_link(df[col]).any()]
-    return df.drop(columns=columns_with_links), columns_with_links
+from services.data_loading import load_upload
+from services.dataset_cache import Dataset, DatasetCache, content_hash
+from services.link_detection import filter_columns_with_links
+
+@st.cache_resource
+def get_dataset_cache() -> DatasetCache:
+    """Cache compartilhado por todas as sessões."""
+    return DatasetCache()
+
+def load_dataset(uploaded_file) -> Dataset:
+    """Carrega o upload, reaproveitando o resultado de reruns anteriores com os mesmos bytes."""
+    # O hash é calculado uma vez por arquivo enviado
+    hashes = st.session_state.setdefault("upload_hashes", {})
+    file_id = getattr(uploaded_file, "file_id", uploaded_file.name)
+    if file_id not in hashes:
+        hashes[file_id] = content_hash(uploaded_file.getbuffer())
+
+    def build():
+        df = load_upload(uploaded_file)
+        # Filtra as colunas que contêm links
+        df_filtered, columns_with_links = filter_columns_with_links(df)
+        return Dataset(df=df, df_filtered=df_filtered, columns_with_links=columns_with_links,
+                       table=Table.from_dataframe(df_filtered))
+
+    return get_dataset_cache().get_or_load(hashes[file_id], build)
 
 def main():
     st.title("DataSage - Facilitated Data Analysis")
@@ -36,20 +48,15 @@ def main():
         st.session_state.sweetviz_report_generated = False
 
     if uploaded_file is not None:
-        # Carregue os dados (substitua pelo seu método de carregamento)
-        lines = uploaded_file.read().decode("utf-8").splitlines()
-        lines = parse_to_csv(lines)
-        
-        # Corrigido para usar StringIO
-        df = pd.read_csv(io.StringIO("\n".join(lines)))
+        # Lê o upload direto do buffer, ou do cache se os mesmos bytes já foram processados
+        dataset = load_dataset(uploaded_file)
+        df = dataset.df
 
         if df is not None:
             st.write("Data Loaded:")
             st.write(df)
 
-            # Filtra as colunas que contêm links
-            df_filtered, columns_with_links = filter_columns_with_links(df)
-            table = Table.from_dataframe(df_filtered)
+            df_filtered, table = dataset.df_filtered, dataset.table
 
             # Sidebar for navigation
             st.sidebar.title("Navigation sidebar")
@@ -123,12 +130,12 @@ def main():
                 time_column = st.selectbox("Select time column for time series", table.numeric_columns)
                 time_series_value_columns = st.multiselect("Select value columns for time series", table.numeric_columns)
 
-                frequency = st.number_input("Enter frequency of time series", value=1)
-
                 if not time_series_value_columns or not time_column:
                     st.warning("Please select time column and value columns for time series.")
                 else:
-                    serie = TimeSeries.from_table(table, time_column, time_series_value_columns, frequency)
+                    serie = TimeSeries.from_table(table, time_column, time_series_value_columns, None)
+                    # Sugere o período dominante encontrado pelo periodograma e pela autocorrelação
+                    serie.frequency = st.number_input("Enter frequency of time series", value=serie.suggest_frequency(), min_value=1)
                     st.write("Data:")
                     st.write(serie.data)
                     st.write("Timestamps:")
@@ -160,8 +167,29 @@ def main():
                 if not linear_regression_x or not linear_regression_y:
                     st.warning("Please select x and y columns for linear regression.")
                 else:
+                    regression_type = st.selectbox("Regression type", ["OLS", "Ridge", "Lasso", "Elastic net"])
+                    selection_method = None
+                    if regression_type == "OLS":
+                        selection_method = st.selectbox("Select X columns automatically",
+                                                        ["No", "Forward", "Backward", "Best subset"])
+                        selection_method = None if selection_method == "No" else selection_method.lower().replace(" ", "_")
+                        selection_criterion = st.selectbox("Selection criterion", ["AIC", "BIC"]) if selection_method else None
                     mlr = MultipleLinearRegression.from_table(table, linear_regression_x, linear_regression_y)
-                    mlr.fit()
+                    try:
+                        if selection_method is not None:
+                            mlr.fit_selected(selection_method, selection_criterion.lower(), executor="thread")
+                            st.write("Selected X columns:", mlr.columns_x)
+                            st.dataframe(mlr.selection.steps)
+                        elif regression_type == "OLS":
+                            mlr.fit()
+                        else:
+                            # Alpha escolhido por validação cruzada ao longo do caminho de regularização
+                            # Sem pool: cada rerun do Streamlit refaz o ajuste, e o caminho leva décimos de segundo
+                            mlr.fit_regularized(regression_type.lower().replace(" ", "_"), workers=1)
+                            st.write("Alpha chosen by cross-validation:", dict(zip(linear_regression_y, mlr.alpha)))
+                    except ValueError as error:
+                        st.error(f"Could not fit the regression: {error}")
+                        return
                     #buuton to generate general report
                     if st.button("Generate General Report"):
                         figs = mlr.general_report()
@@ -170,6 +198,9 @@ def main():
                                 st.pyplot(fig)
                         else:
                             st.warning("No figures generated.")
+                        summary = mlr.summary()
+                        st.write("R²:", summary['r_squared'], "Adjusted R²:", summary['adjusted_r_squared'])
+                        st.dataframe(summary['coefficients'])
                     
 
 if __name__ == "__main__":
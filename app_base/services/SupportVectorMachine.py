@@ -2,6 +2,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 from enum import Enum
+from .table_class import Table
 
 class Kernel(Enum):
     LINEAR = 'linear'
@@ -72,4 +73,12 @@ class SupportVectorRegression3D:
         ax.set_ylabel('X2')
         ax.set_zlabel('Y')
         plt.title('SVM: Superfície de Regressão')
-        plt.show()
\ No newline at end of file
+        plt.show()
+
+    @classmethod
+    def from_table(cls, table: Table, columns_x: list[str], column_y: str, **options) -> 'SupportVectorRegression3D':
+        if not all([column in table.numeric_columns for column in columns_x + [column_y]]):
+            raise ValueError("All columns in X and Y must be numeric.")
+        x = table.to_array(columns_x)
+        y = table.to_array([column_y])[:, 0]
+        return cls(X=x, Y=y, **options)
@@ -0,0 +1,190 @@
+from collections import OrderedDict
+from typing import Optional
+import hashlib
+import threading
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+from .type_inference import ColumnType
+
+# Tamanho dos blocos usados no cálculo incremental de média e variância
+CHUNK_SIZE = 1 << 16
+# Quantidade de perfis de coluna mantidos em memória
+PROFILE_CACHE_SIZE = 1024
+
+class RunningMoments:
+    """
+    Count, mean, variance, min and max accumulated chunk by chunk.
+
+    Each chunk is reduced with NumPy and merged with the running state using
+    the parallel form of Welford's algorithm (Chan et al.), so the result is
+    numerically stable and two accumulators can be merged. Chunks may be 1-D
+    (one series) or 2-D (one statistic per column); NaN values are ignored.
+    """
+
+    def __init__(self):
+        self.count = None
+        self.mean = None
+        self.m2 = None
+        self.minimum = None
+        self.maximum = None
+
+    def update(self, chunk):
+        chunk = np.asarray(chunk, dtype=np.float64)
+        valid = ~np.isnan(chunk)
+        if len(chunk) and valid.all():
+            # Caso comum sem NaN: evita as cópias mascaradas
+            count = np.full(chunk.shape[1:], len(chunk))
+            mean = chunk.mean(axis=0)
+            deviations = chunk - mean
+            m2 = np.einsum('i...,i...->...', deviations, deviations)
+            self._merge(count, mean, m2, chunk.min(axis=0), chunk.max(axis=0))
+            return self
+        count = valid.sum(axis=0)
+        safe = np.where(valid, chunk, 0.0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = safe.sum(axis=0) / count
+            m2 = (np.where(valid, chunk - mean, 0.0) ** 2).sum(axis=0)
+        minimum = np.where(valid, chunk, np.inf).min(axis=0, initial=np.inf)
+        maximum = np.where(valid, chunk, -np.inf).max(axis=0, initial=-np.inf)
+        self._merge(count, np.nan_to_num(mean), m2, minimum, maximum)
+        return self
+
+    def merge(self, other: 'RunningMoments') -> 'RunningMoments':
+        if other.count is not None:
+            self._merge(other.count, other.mean, other.m2, other.minimum, other.maximum)
+        return self
+
+    def _merge(self, count, mean, m2, minimum, maximum):
+        if self.count is None:
+            self.count, self.mean, self.m2 = count, mean, m2
+            self.minimum, self.maximum = minimum, maximum
+            return
+        total = self.count + count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean - self.mean
+            weight = np.where(total > 0, count / total, 0.0)
+            self.mean = self.mean + delta * weight
+            self.m2 = self.m2 + m2 + delta ** 2 * self.count * weight
+        self.count = total
+        self.minimum = np.minimum(self.minimum, minimum)
+        self.maximum = np.maximum(self.maximum, maximum)
+
+    @property
+    def variance(self):
+        """Population variance, like np.var."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 0, self.m2 / self.count, np.nan)
+
+    @property
+    def std_dev(self):
+        return np.sqrt(self.variance)
+
+def running_moments(values, chunk_size=CHUNK_SIZE) -> RunningMoments:
+    """Accumulate the moments of an array in a single pass over row chunks."""
+    moments = RunningMoments()
+    for start in range(0, len(values), chunk_size):
+        moments.update(values[start:start + chunk_size])
+    return moments
+
+def select_median(values: np.ndarray) -> float:
+    """Median through selection (np.partition) instead of a full sort."""
+    n = values.size
+    mid = n // 2
+    if n % 2:
+        return float(np.partition(values, mid)[mid])
+    partitioned = np.partition(values, [mid - 1, mid])
+    return float((partitioned[mid - 1] + partitioned[mid]) / 2)
+
+def hash_mode(values: np.ndarray):
+    """Most frequent value and its count, counted with a hash table."""
+    counts = pd.Series(values, copy=False).value_counts(sort=False)
+    position = int(counts.to_numpy().argmax())
+    mode = counts.index[position]
+    mode = mode.item() if isinstance(mode, np.generic) else mode
+    # Datas e durações (Timestamp, Timedelta) viram texto, como as demais colunas String
+    if not isinstance(mode, (str, int, float)):
+        mode = str(mode)
+    return mode, int(counts.iloc[position])
+
+class ColumnStats(BaseModel):
+    """Statistics of a column, computed once from its values."""
+    count: int
+    null_count: int
+    mode: Optional[str|int|float] = None
+    mode_count: int = 0
+    mean: Optional[float] = None
+    variance: Optional[float] = None
+    std_dev: Optional[float] = None
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    median: Optional[float] = None
+
+def compute_column_stats(values: np.ndarray, null_mask: np.ndarray, value_type: ColumnType) -> ColumnStats:
+    present = values[~null_mask] if null_mask.any() else values
+    stats = ColumnStats(count=int(present.size), null_count=int(values.size - present.size))
+    if not present.size:
+        return stats
+    stats.mode, stats.mode_count = hash_mode(present)
+    if value_type not in (ColumnType.Int, ColumnType.Float):
+        return stats
+    moments = running_moments(present)
+    stats.mean = float(moments.mean)
+    stats.variance = float(moments.variance)
+    stats.std_dev = float(moments.std_dev)
+    stats.minimum = float(moments.minimum)
+    stats.maximum = float(moments.maximum)
+    stats.median = select_median(present)
+    return stats
+
+class ColumnProfile(BaseModel):
+    """Type and statistics of a column, identified by the fingerprint of its contents."""
+    fingerprint: str
+    value_type: ColumnType
+    stats: ColumnStats
+
+def content_fingerprint(values: np.ndarray, value_type: Optional[ColumnType] = None) -> str:
+    """
+    Hash of the inferred type, dtype and contents of an array, cheap
+    compared to profiling it. The type is part of the key because the same
+    bytes profile differently as, say, Int and Float.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{value_type.value if value_type is not None else ''}|{values.dtype}".encode())
+    if values.dtype == object:
+        # Objetos Python não têm bytes estáveis: usa o hash vetorizado do pandas
+        values = pd.util.hash_array(values)
+    elif values.dtype.kind in 'Mm':
+        # datetime64/timedelta64 não expõem buffer: os mesmos bytes vistos como inteiros
+        values = values.view('i8')
+    digest.update(np.ascontiguousarray(values).data)
+    return digest.hexdigest()
+
+_profile_cache: OrderedDict[str, ColumnProfile] = OrderedDict()
+_profile_lock = threading.Lock()
+
+def cached_profile(fingerprint: str) -> Optional[ColumnProfile]:
+    with _profile_lock:
+        profile = _profile_cache.get(fingerprint)
+        if profile is not None:
+            _profile_cache.move_to_end(fingerprint)
+        return profile
+
+def store_profile(profile: ColumnProfile):
+    """Keep a profile for later columns with the same contents, evicting the least recently used."""
+    with _profile_lock:
+        _profile_cache[profile.fingerprint] = profile
+        _profile_cache.move_to_end(profile.fingerprint)
+        while len(_profile_cache) > PROFILE_CACHE_SIZE:
+            _profile_cache.popitem(last=False)
+
+def profile_column(values: np.ndarray, null_mask: np.ndarray, value_type: ColumnType, fingerprint: Optional[str] = None) -> ColumnProfile:
+    """Return the memoized profile of a column, computing its statistics only on a cache miss."""
+    if fingerprint is None:
+        fingerprint = content_fingerprint(values, value_type)
+    profile = cached_profile(fingerprint)
+    if profile is None:
+        profile = ColumnProfile(fingerprint=fingerprint, value_type=value_type,
+                                stats=compute_column_stats(values, null_mask, value_type))
+        store_profile(profile)
+    return profile
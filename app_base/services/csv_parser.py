@@ -1,6 +1,100 @@
+import io
+from collections import Counter
+import numpy as np
+import pandas as pd
+
+# Tamanho máximo da amostra usada para descobrir o delimitador
+SNIFF_SAMPLE_BYTES = 1 << 20
+# Tamanho aproximado de cada bloco entregue ao leitor de CSV
+CHUNK_SIZE_BYTES = 1 << 20
+# Tamanho dos blocos de bytes analisados de uma vez pelo detector
+SCAN_BLOCK_BYTES = 1 << 22
+# Delimitadores em ordem de preferência
+DELIMITERS = (',', '\t', '   ', ';')
+
+_QUOTE = ord('"')
+_NEWLINE = ord('\n')
+_CARRIAGE_RETURN = ord('\r')
+_SPACE = ord(' ')
+
+def delimiter_histograms(buffer, delimiters=DELIMITERS) -> dict[str, dict[int, int]]:
+    """
+    Count fields per line for each delimiter in a single pass over raw bytes.
+
+    Delimiters and line breaks inside double quotes are ignored and blank
+    lines are skipped. Returns, for each delimiter, a histogram mapping the
+    number of fields in a line to the number of lines with that many fields.
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    histograms = {delimiter: Counter() for delimiter in delimiters}
+    # Estado que atravessa as fronteiras entre blocos
+    in_quotes = 0
+    partial_length = 0
+    partial_counts = dict.fromkeys(delimiters, 0)
+    space_run = 0
+
+    for offset in range(0, data.size, SCAN_BLOCK_BYTES):
+        block = data[offset:offset + SCAN_BLOCK_BYTES]
+        quotes = block == _QUOTE
+        if quotes.any():
+            unquoted = (np.bitwise_xor.accumulate(quotes.view(np.uint8)) ^ in_quotes) == 0
+        else:
+            unquoted = np.full(block.size, not in_quotes)
+        in_quotes = 0 if unquoted[-1] else 1
+
+        # Posições das quebras de linha; a linha de cada byte sai de uma busca binária
+        breaks = np.flatnonzero((block == _NEWLINE) & unquoted)
+        n_lines = breaks.size + 1
+        bounds = np.concatenate(([-1], breaks, [block.size]))
+        carriage_returns = np.flatnonzero(block == _CARRIAGE_RETURN)
+        lengths = np.diff(bounds) - 1 - np.bincount(np.searchsorted(breaks, carriage_returns), minlength=n_lines)
+        lengths[0] += partial_length
+
+        for delimiter in delimiters:
+            if len(delimiter) == 1:
+                hits = np.flatnonzero((block == ord(delimiter)) & unquoted)
+            else:
+                hits, space_run = _count_space_runs(block, unquoted, len(delimiter), space_run)
+            counts = np.bincount(np.searchsorted(breaks, hits), minlength=n_lines)
+            counts[0] += partial_counts[delimiter]
+            # A última linha do bloco pode continuar no próximo
+            partial_counts[delimiter] = int(counts[-1])
+            complete = counts[:-1][lengths[:-1] > 0] + 1
+            fields, occurrences = np.unique(complete, return_counts=True)
+            histograms[delimiter].update(dict(zip(fields.tolist(), occurrences.tolist())))
+        partial_length = int(lengths[-1])
+
+    if partial_length:
+        for delimiter in delimiters:
+            histograms[delimiter][partial_counts[delimiter] + 1] += 1
+    return {delimiter: dict(histogram) for delimiter, histogram in histograms.items()}
+
+def _count_space_runs(block, unquoted, width, carried_run):
+    """Positions of every `width`-th space of each unquoted run, like str.count on a run of spaces."""
+    spaces = np.flatnonzero((block == _SPACE) & unquoted)
+    if not spaces.size:
+        return spaces, 0
+    # Início da sequência de espaços a que cada espaço pertence
+    new_run = np.concatenate(([True], np.diff(spaces) != 1))
+    run_starts = np.maximum.accumulate(np.where(new_run, spaces, 0))
+    if spaces[0] == 0 and carried_run:
+        run_starts[run_starts == 0] = -carried_run
+    hits = spaces[(spaces - run_starts) % width == width - 1]
+    carried_run = int(block.size - run_starts[-1]) if spaces[-1] == block.size - 1 else 0
+    return hits, carried_run
+
+def detect_delimiter(buffer) -> str:
+    """Return the first delimiter that splits every non-blank line into the same number (>1) of fields."""
+    histograms = delimiter_histograms(buffer)
+    for delimiter in DELIMITERS:
+        field_counts = list(histograms[delimiter])
+        if len(field_counts) == 1 and field_counts[0] > 1:
+            return delimiter
+    raise ValueError('Could not parse lines as CSV file')
+
 def check_delimiter_consistency(lines, delimiter):
-    counts = [line.count(delimiter) for line in lines]
-    return len(set(counts)) == 1 and counts[0] > 0
+    histogram = delimiter_histograms('\n'.join(lines).encode('utf-8'), (delimiter,))[delimiter]
+    return len(histogram) == 1 and list(histogram)[0] > 1
 
 def swap_commas_and_semicolons(line):
     # Escape backslashes first
@@ -19,26 +113,93 @@ def swap_tabs_with_commas(line):
 def swap_triple_spaces_with_commas(line):
     return line.replace('   ', ',')
 
+def swap_semicolons_with_commas(line):
+    # Commas inside the fields become semicolons, as in the other delimiters
+    return line.translate({ord(','): ';', ord(';'): ','})
+
+def sniff_delimiter(lines: list[str]) -> str:
+    """Return the delimiter that splits every line consistently."""
+    return detect_delimiter('\n'.join(lines).encode('utf-8'))
+
+def normalize_line(line: str, delimiter: str) -> str:
+    """Rewrite a single line so that it is comma separated."""
+    if delimiter == ',':
+        return line
+    if delimiter == ';':
+        return swap_semicolons_with_commas(line)
+    line = swap_commas_and_semicolons(line)
+    if delimiter == '\t':
+        return swap_tabs_with_commas(line)
+    return swap_triple_spaces_with_commas(line)
+
 def parse_to_csv(lines: list[str]) -> list[str]:
-    # Check if commas are consistent
-    if check_delimiter_consistency(lines, ','):
+    delimiter = sniff_delimiter(lines)
+    if delimiter == ',':
         return lines
+    return [normalize_line(line, delimiter) for line in lines]
 
-    # Swap commas and semicolons
-    swapped_lines = [swap_commas_and_semicolons(line) for line in lines]
-
-    # Try splitting by TAB characters
-    if check_delimiter_consistency(swapped_lines, '\t'):
-        # Swap tabs with commas
-        final_lines = [swap_tabs_with_commas(line) for line in swapped_lines]
-        return final_lines
-
-    # Try splitting by three consecutive spaces
-    if check_delimiter_consistency(swapped_lines, '   '):
-        # Swap triple spaces with commas
-        final_lines = [swap_triple_spaces_with_commas(line) for line in swapped_lines]
-        return final_lines
-    # If none of the above work, print an error
-    raise ValueError('Could not parse lines as CSV file')
+def read_sample(stream, sample_bytes=SNIFF_SAMPLE_BYTES):
+    """Read a prefix of the stream that ends on a line boundary."""
+    sample = stream.read(sample_bytes)
+    if len(sample) == sample_bytes:
+        # Completa a última linha para não cortar um registro ao meio
+        sample += stream.readline()
+    return sample
+
+def iter_csv_chunks(stream, sample_bytes=SNIFF_SAMPLE_BYTES, chunk_size=CHUNK_SIZE_BYTES, encoding='utf-8', delimiter=None):
+    """
+    Lazily yield comma separated bytes chunks from a binary stream.
+
+    Unless given, the delimiter is sniffed from a bounded prefix of the
+    stream; the rest of the input is normalized line by line, so memory
+    stays bounded by the sample and chunk sizes regardless of the input length.
+    """
+    sample = read_sample(stream, sample_bytes)
+    if delimiter is None:
+        delimiter = detect_delimiter(sample)
+
+    if delimiter == ',':
+        # Nada a reescrever: repassa os bytes como estão
+        yield sample
+        while True:
+            block = stream.read(chunk_size)
+            if not block:
+                return
+            yield block
+
+    def normalized(lines):
+        return ''.join(normalize_line(line, delimiter) for line in lines).encode(encoding)
+
+    yield normalized(sample.decode(encoding).splitlines(keepends=True))
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            return
+        block += stream.readline()
+        yield normalized(block.decode(encoding).splitlines(keepends=True))
+
+class ChunkStream(io.RawIOBase):
+    """Read-only file object over an iterator of bytes chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b'')
+
+    def readable(self):
+        return True
 
+    def readinto(self, buffer):
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
 
+def read_csv_streaming(stream, delimiter=None, **kwargs) -> pd.DataFrame:
+    """Parse a binary stream into a DataFrame without materializing its lines."""
+    chunks = iter_csv_chunks(stream, delimiter=delimiter)
+    return pd.read_csv(io.BufferedReader(ChunkStream(chunks), buffer_size=CHUNK_SIZE_BYTES), **kwargs)
@@ -1,4 +1,5 @@
 import pandas as pd
+from .csv_parser import detect_delimiter, read_csv_streaming, read_sample
 
 def load_data(lines: list[str], delimiter=','):
     try:
@@ -14,3 +15,20 @@ def load_data(lines: list[str], delimiter=','):
     except Exception as e:
         print(f"Error loading CSV: {e}")
         return None
+
+def load_upload(uploaded_file) -> pd.DataFrame:
+    """
+    Load an uploaded binary file (e.g. Streamlit's UploadedFile) into a DataFrame.
+
+    Comma separated files are handed to pandas' C engine as-is, without
+    decoding the bytes into Python strings; other delimiters go through
+    the streaming normalizer of csv_parser. The C engine is kept on purpose:
+    it renames repeated headers ("Term Source REF", "Unit" in OSDR files)
+    and leaves dates as text for the type inference.
+    """
+    uploaded_file.seek(0)
+    delimiter = detect_delimiter(read_sample(uploaded_file))
+    uploaded_file.seek(0)
+    if delimiter == ',':
+        return pd.read_csv(uploaded_file, engine="c")
+    return read_csv_streaming(uploaded_file, delimiter=delimiter)
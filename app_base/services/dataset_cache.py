@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from typing import Callable, Optional
+import hashlib
+import threading
+import pandas as pd
+from pydantic import BaseModel, ConfigDict
+from .table_class import Table
+
+class Dataset(BaseModel):
+    """An uploaded file after parsing: raw frame, frame without link columns and its Table."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    df: pd.DataFrame
+    df_filtered: pd.DataFrame
+    columns_with_links: list[str]
+    table: Table
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory of both frames, including the Python strings of object
+        columns. It walks every cell, so the cache computes it once per entry.
+        """
+        # As células de df_filtered apontam para as mesmas strings de df: só os ponteiros contam de novo
+        return int(self.df.memory_usage(deep=True).sum() + self.df_filtered.memory_usage(deep=False).sum())
+
+def content_hash(buffer) -> str:
+    """Hash of the uploaded bytes, used as the cache key."""
+    return hashlib.blake2b(buffer, digest_size=16).hexdigest()
+
+class DatasetCache:
+    """
+    LRU cache of parsed datasets keyed by the hash of the uploaded bytes.
+
+    Entries are evicted, least recently used first, when there are more than
+    `max_entries` of them or their size (measured once, on insertion)
+    exceeds `max_bytes`. The cache is thread safe so it can be shared by
+    every Streamlit session.
+    """
+
+    def __init__(self, max_entries: int = 8, max_bytes: int = 2 << 30):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, Dataset] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: str):
+        return key in self._entries
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def get(self, key: str) -> Optional[Dataset]:
+        with self._lock:
+            dataset = self._entries.get(key)
+            if dataset is not None:
+                self._entries.move_to_end(key)
+            return dataset
+
+    def put(self, key: str, dataset: Dataset):
+        # Medido fora do lock: percorre todas as strings do dataset
+        size = dataset.nbytes
+        with self._lock:
+            self._nbytes += size - self._sizes.get(key, 0)
+            self._entries[key] = dataset
+            self._sizes[key] = size
+            self._entries.move_to_end(key)
+            # Sempre mantém a entrada mais recente, mesmo que sozinha passe do limite
+            while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._nbytes > self.max_bytes):
+                evicted, _ = self._entries.popitem(last=False)
+                self._nbytes -= self._sizes.pop(evicted)
+
+    def get_or_load(self, key: str, loader: Callable[[], Dataset]) -> Dataset:
+        """Return the cached dataset for `key`, calling `loader` only on a miss."""
+        dataset = self.get(key)
+        if dataset is None:
+            dataset = loader()
+            self.put(key, dataset)
+        return dataset
@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from .rolling import rolling
+
+# Colunas por tarefa quando a decomposição é dividida entre threads
+COLUMNS_PER_TASK = 64
+
+def moving_average_trend(data: np.ndarray, period: int) -> np.ndarray:
+    """
+    Centered moving average used by statsmodels' seasonal_decompose: a window
+    of `period` samples for odd periods and a 2 x period filter (period + 1
+    samples, half weight at both ends) for even ones. Edges are NaN.
+    """
+    if period % 2:
+        return rolling(data, period, 'mean', center=True)
+    n = data.shape[0]
+    half = period // 2
+    trend = rolling(data, period + 1, 'sum', center=True)
+    trend[half:n - half] -= 0.5 * (data[:n - period] + data[period:])
+    return trend / period
+
+def _decompose_block(data: np.ndarray, period: int):
+    n = data.shape[0]
+    trend = moving_average_trend(data, period)
+    detrended = data - trend
+
+    # Média de cada fase do ciclo, todas as colunas de uma vez
+    cycles = -(-n // period)
+    padded = np.full((cycles * period, data.shape[1]), np.nan)
+    padded[:n] = detrended
+    period_averages = np.nanmean(padded.reshape(cycles, period, -1), axis=0)
+    period_averages -= period_averages.mean(axis=0)
+
+    seasonal = np.tile(period_averages, (cycles, 1))[:n]
+    return trend, seasonal, detrended - seasonal
+
+def decompose(data, period: int, workers: int = 1):
+    """
+    Additive seasonal decomposition of every column of a 2-D array (n_samples, n_series).
+
+    Reproduces statsmodels' seasonal_decompose(model='additive') in one
+    vectorized pass: moving-average trend, per-phase seasonal averages and
+    residuals. With more than one worker, wide inputs are split into column
+    blocks decomposed in parallel threads. Returns (trend, seasonal, residual).
+    """
+    data = np.asarray(data, dtype=np.float64)
+    if data.ndim != 2:
+        raise ValueError("Data must be two-dimensional (samples x series).")
+    if period is None or int(period) != period or period < 1:
+        raise ValueError("Period must be a positive integer.")
+    period = int(period)
+    if not np.all(np.isfinite(data)):
+        raise ValueError("This function does not handle missing values")
+    if data.shape[0] < 2 * period:
+        raise ValueError(f"x must have 2 complete cycles requires {2 * period} observations. x only has {data.shape[0]} observation(s)")
+
+    if workers <= 1 or data.shape[1] <= COLUMNS_PER_TASK:
+        return _decompose_block(data, period)
+    blocks = [data[:, start:start + COLUMNS_PER_TASK] for start in range(0, data.shape[1], COLUMNS_PER_TASK)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda block: _decompose_block(block, period), blocks))
+    return tuple(np.hstack(component) for component in zip(*results))
@@ -0,0 +1,198 @@
+from typing import Iterable, Optional
+import numpy as np
+from .column_stats import CHUNK_SIZE, RunningMoments, running_moments
+
+# Capacidade do nível mais alto do sketch; o erro de posto fica em torno de 1/k
+SKETCH_SIZE = 200
+
+def _as_2d(data) -> tuple[np.ndarray, bool]:
+    data = np.asarray(data, dtype=np.float64)
+    if data.ndim == 1:
+        return data[:, None], True
+    if data.ndim != 2:
+        raise ValueError("Data should be either 1D or 2D.")
+    return data, False
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch (KLL) for every column of a stream of row chunks.
+
+    Items live in levels of compactors; an item at level h stands for 2**h
+    input values. A full compactor is sorted and every other item (with a
+    random offset) is promoted to the next level, so memory stays around
+    3 * k items per column whatever the length of the stream, and the rank
+    error of a quantile is about 1/k. All columns share the compaction
+    schedule, so each step is one NumPy sort over the whole level. NaN values
+    are carried with zero weight and ignored by the queries.
+    """
+
+    def __init__(self, k: int = SKETCH_SIZE, seed: Optional[int] = None):
+        if k < 2:
+            raise ValueError("Sketch size must be at least 2.")
+        self.k = k
+        self.levels: list[np.ndarray] = []
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        # Níveis mais baixos (itens de menor peso) guardam menos itens
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _add(self, level: int, items: np.ndarray):
+        if level == len(self.levels):
+            self.levels.append(items)
+        else:
+            self.levels[level] = np.vstack((self.levels[level], items))
+
+    def update(self, chunk) -> 'QuantileSketch':
+        chunk, _ = _as_2d(chunk)
+        if len(chunk):
+            if self.levels and self.levels[0].shape[1] != chunk.shape[1]:
+                raise ValueError(f"Chunks must have {self.levels[0].shape[1]} column(s).")
+            self._add(0, chunk.copy())
+            self.count += len(chunk)
+            self._compress()
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        for level, items in enumerate(other.levels):
+            self._add(level, items)
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                items = np.sort(items, axis=0)
+                # Com tamanho ímpar, o maior item fica neste nível
+                kept = len(items) % 2
+                offset = int(self._rng.integers(2))
+                self.levels[level] = items[len(items) - kept:]
+                self._add(level + 1, items[offset:len(items) - kept:2])
+            level += 1
+
+    def quantile(self, q):
+        """Approximate q-quantile(s) of each column; NaN for columns without values."""
+        q = np.asarray(q, dtype=np.float64)
+        if not self.levels:
+            raise ValueError("The sketch is empty.")
+        items = np.vstack(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, axis=0)
+        items = np.take_along_axis(items, order, axis=0)
+        weights = np.where(np.isnan(items), 0.0, weights[order])
+        cumulative = np.cumsum(weights, axis=0)
+        total = cumulative[-1]
+
+        targets = np.atleast_1d(q)[:, None] * total
+        # Primeiro item cujo peso acumulado alcança o posto pedido, por coluna
+        positions = (cumulative[None, :, :] < targets[:, None, :]).sum(axis=1)
+        positions = np.minimum(positions, len(items) - 1)
+        result = np.take_along_axis(items, positions, axis=0)
+        result = np.where(total > 0, result, np.nan)
+        return result.reshape(q.shape + result.shape[1:])
+
+def exact_quantiles(data, q) -> np.ndarray:
+    """
+    Quantiles of each column with linear interpolation (like np.nanquantile),
+    found by selection with np.partition instead of a full sort.
+    """
+    values, _ = _as_2d(data)
+    q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+    result = np.full((len(q), values.shape[1]), np.nan)
+    missing = np.isnan(values).any(axis=0)
+
+    def select(block: np.ndarray) -> np.ndarray:
+        position = q * (len(block) - 1)
+        lower, upper = np.floor(position).astype(int), np.ceil(position).astype(int)
+        partitioned = np.partition(block, np.unique(np.concatenate((lower, upper))), axis=0)
+        fraction = (position - lower)[:, None]
+        return partitioned[lower] * (1 - fraction) + partitioned[upper] * fraction
+
+    complete = np.flatnonzero(~missing)
+    if len(complete) and len(values):
+        result[:, complete] = select(values[:, complete])
+    # Colunas com NaN têm tamanhos diferentes e são tratadas uma a uma
+    for column in np.flatnonzero(missing):
+        present = values[~np.isnan(values[:, column]), column]
+        if len(present):
+            result[:, column] = select(present[:, None])[:, 0]
+    return result
+
+def _summary(moments: RunningMoments, median: np.ndarray, quantiles: dict, is_1d: bool) -> dict:
+    def shape(values):
+        values = np.asarray(values)
+        return values[0].item() if is_1d else values
+
+    summary = {
+        'mean': shape(np.where(moments.count > 0, moments.mean, np.nan)),
+        'median': shape(median),
+        'std_dev': shape(moments.std_dev),
+        'min': shape(np.where(moments.count > 0, moments.minimum, np.nan)),
+        'max': shape(np.where(moments.count > 0, moments.maximum, np.nan)),
+        'count': shape(moments.count.astype(int))
+    }
+    if quantiles:
+        summary['quantiles'] = {level: shape(values) for level, values in quantiles.items()}
+    return summary
+
+def describe(data, quantiles: Iterable[float] = (), chunk_size: int = CHUNK_SIZE) -> dict:
+    """
+    Count, mean, std (population), min, max and median of a 1-D series or of
+    every column of a 2-D array, ignoring NaN values.
+
+    The moments come from one pass over row chunks and the median (plus any
+    extra `quantiles`) from np.partition. A 1-D input gives scalars, a 2-D
+    input one value per column.
+    """
+    values, is_1d = _as_2d(data)
+    moments = running_moments(values, chunk_size)
+    if moments.count is None:
+        moments.update(values)
+    levels = [0.5] + [float(level) for level in quantiles]
+    selected = exact_quantiles(values, levels)
+    return _summary(moments, selected[0], dict(zip(levels[1:], selected[1:])), is_1d)
+
+class StreamingDescriber:
+    """
+    Describe a series that arrives (or is read) chunk by chunk, with memory
+    independent of its length: merged moments plus a KLL sketch for the
+    median and other quantiles. Two describers can be merged, so chunks may
+    be summarized in parallel.
+    """
+
+    def __init__(self, quantiles: Iterable[float] = (), k: int = SKETCH_SIZE, seed: Optional[int] = None):
+        self.levels = [0.5] + [float(level) for level in quantiles]
+        self.moments = RunningMoments()
+        self.sketch = QuantileSketch(k, seed)
+        self._is_1d = None
+
+    def update(self, chunk) -> 'StreamingDescriber':
+        values, is_1d = _as_2d(chunk)
+        self._is_1d = is_1d if self._is_1d is None else self._is_1d
+        self.moments.update(values)
+        self.sketch.update(values)
+        return self
+
+    def merge(self, other: 'StreamingDescriber') -> 'StreamingDescriber':
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        self._is_1d = other._is_1d if self._is_1d is None else self._is_1d
+        return self
+
+    def describe(self) -> dict:
+        if self.moments.count is None:
+            raise ValueError("No data has been added.")
+        selected = self.sketch.quantile(self.levels)
+        return _summary(self.moments, selected[0], dict(zip(self.levels[1:], selected[1:])), self._is_1d)
+
+def describe_chunks(chunks: Iterable, quantiles: Iterable[float] = (), k: int = SKETCH_SIZE) -> dict:
+    """describe() for data that does not fit in memory, from an iterable of row chunks (approximate quantiles)."""
+    describer = StreamingDescriber(quantiles, k)
+    for chunk in chunks:
+        describer.update(chunk)
+    return describer.describe()
@@ -0,0 +1,100 @@
+import numpy as np
+
+class MinMaxPyramid:
+    """
+    Level-of-detail index of a (samples x series) array for plotting.
+
+    Level k stores, for every bucket of 2**k consecutive samples and every
+    series, the positions of the bucket's minimum and maximum. Building all
+    levels costs O(n); a query for any range and screen width reads at most
+    about 2 * width buckets from the coarsest sufficient level, so drawing
+    a zoom level takes the same time however long the series is. Keeping
+    each bucket's extremes (the idea behind M4 downsampling) preserves the
+    visual envelope of the line.
+    """
+
+    def __init__(self, data):
+        data = np.asarray(data, dtype=np.float64)
+        self.values = data.reshape(data.shape[0], -1)
+        n, m = self.values.shape
+        # NaN não pode ganhar as comparações de mínimo e máximo
+        low = np.where(np.isnan(self.values), np.inf, self.values)
+        high = np.where(np.isnan(self.values), -np.inf, self.values)
+
+        index = np.broadcast_to(np.arange(n)[:, None], (n, m))
+        self.levels = [(index, index)]
+        while len(self.levels[-1][0]) > 1:
+            argmin, argmax = self.levels[-1]
+            if len(argmin) % 2:
+                # Repete o último balde para formar pares
+                argmin = np.vstack((argmin, argmin[-1:]))
+                argmax = np.vstack((argmax, argmax[-1:]))
+            columns = np.arange(m)
+            left_min, right_min = argmin[0::2], argmin[1::2]
+            left_max, right_max = argmax[0::2], argmax[1::2]
+            new_min = np.where(low[right_min, columns] < low[left_min, columns], right_min, left_min)
+            new_max = np.where(high[right_max, columns] > high[left_max, columns], right_max, left_max)
+            self.levels.append((new_min, new_max))
+
+    def __len__(self):
+        return self.values.shape[0]
+
+    def query(self, width: int, start: int = 0, stop=None) -> list[np.ndarray]:
+        """
+        Sorted sample positions to draw for each series so that the range
+        [start, stop) fits about `width` buckets: first, last, min and max of each.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        start = max(0, start)
+        if stop <= start:
+            return [np.empty(0, dtype=int) for _ in range(self.values.shape[1])]
+        span = stop - start
+        level = 0 if span <= width else min(int(np.ceil(np.log2(span / width))), len(self.levels) - 1)
+        size = 1 << level
+        # Baldes inteiros no meio; as bordas parciais são cobertas por baldes menores
+        full_start, full_stop = -(-start // size) * size, (stop // size) * size
+        if full_start < full_stop:
+            pieces = [self.levels[level][0][full_start // size:full_stop // size],
+                      self.levels[level][1][full_start // size:full_stop // size]]
+            edges = self._cover(start, full_start, level) + self._cover(full_stop, stop, level)
+        else:
+            pieces = []
+            edges = self._cover(start, stop, level)
+        for edge_level, bucket in edges:
+            pieces.append(self.levels[edge_level][0][bucket:bucket + 1])
+            pieces.append(self.levels[edge_level][1][bucket:bucket + 1])
+
+        chosen = np.vstack(pieces)
+        return [np.unique(np.concatenate(([start, stop - 1], chosen[:, column]))) for column in range(self.values.shape[1])]
+
+    def _cover(self, start: int, stop: int, level: int) -> list[tuple[int, int]]:
+        """Aligned buckets (level, index) of at most 2**level samples that exactly cover [start, stop)."""
+        buckets = []
+        while start < stop:
+            size_level = level
+            while start % (1 << size_level) or start + (1 << size_level) > stop:
+                size_level -= 1
+            buckets.append((size_level, start >> size_level))
+            start += 1 << size_level
+        return buckets
+
+def m4_downsample(x, y, width: int):
+    """
+    Reduce a single series to the first, last, minimum and maximum point of
+    each of `width` equal-width buckets (M4 downsampling).
+    """
+    x, y = np.asarray(x), np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= 4 * width:
+        return x, y
+    bucket = np.arange(n) * width // n
+    bounds = np.flatnonzero(np.diff(bucket)) + 1
+    starts = np.concatenate(([0], bounds))
+    ends = np.concatenate((bounds, [n])) - 1
+    low = np.where(np.isnan(y), np.inf, y)
+    high = np.where(np.isnan(y), -np.inf, y)
+    # Ordena por (balde, valor) para achar mínimo e máximo de cada balde sem laço
+    order_low = np.lexsort((low, bucket))
+    order_high = np.lexsort((-high, bucket))
+    chosen = np.unique(np.concatenate((starts, ends, order_low[starts], order_high[starts])))
+    return x[chosen], y[chosen]
@@ -0,0 +1,232 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import combinations, islice
+from math import comb
+from typing import Optional
+import numpy as np
+import pandas as pd
+from scipy import linalg
+from scipy.linalg import blas
+from .regression_fit import information_criterion
+from .regularization import default_workers
+from .streaming_regression import RegressionStatistics
+
+SELECTION_METHODS = ('forward', 'backward', 'best_subset')
+CRITERIA = ('aic', 'bic')
+# Acima disto a busca exaustiva deixa de ser interativa: use forward ou backward
+MAX_SUBSETS = 200_000
+SUBSET_BATCH = 4096
+# Colunas cuja parte não explicada pelas já escolhidas é menor que isto (relativo) são colineares
+COLLINEARITY_TOLERANCE = 1e-8
+
+class FeatureSelection:
+    """
+    Outcome of a feature-subset search: the chosen column indices and one
+    row per step with the action, the column, the total residual sum of
+    squares and the AIC/BIC (summed over the responses) after the step.
+    """
+
+    def __init__(self, method: str, criterion: str, selected: list[int], steps: pd.DataFrame):
+        self.method = method
+        self.criterion = criterion
+        self.selected = selected
+        self.steps = steps
+
+def _step_row(step: int, action: str, column, n_features: int, rss: np.ndarray, n: int) -> dict:
+    return {'step': step, 'action': action, 'column': column, 'n_features': n_features, 'rss': float(rss.sum()),
+            'aic': information_criterion(rss, n, n_features + 1, 'aic').sum(),
+            'bic': information_criterion(rss, n, n_features + 1, 'bic').sum()}
+
+def _steps_frame(rows: list[dict], names: Optional[list[str]]) -> pd.DataFrame:
+    # Coluna de objetos: a linha inicial não tem coluna e as outras viram nomes quando houver
+    label = (lambda i: names[i]) if names is not None else (lambda i: i)
+    columns = [None if column is None else [label(i) for i in column] if isinstance(column, list) else label(column)
+               for column in (row['column'] for row in rows)]
+    steps = pd.DataFrame(rows)
+    steps['column'] = pd.Series(columns, dtype=object)
+    return steps
+
+def _best_step(rows: list[dict], criterion: str) -> int:
+    return int(np.argmin([row[criterion] for row in rows]))
+
+def _score_block(block: np.ndarray, q: Optional[np.ndarray], residuals: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Ortogonaliza o bloco contra a nova coluna da base (atualização de posto um, no lugar) e pontua os candidatos
+    if q is not None:
+        blas.dger(-1.0, q, q @ block, a=block, overwrite_a=True)
+    norms = np.einsum('ij,ij->j', block, block)
+    projections = block.T @ residuals
+    return norms, projections
+
+def forward_selection(X: np.ndarray, Y: np.ndarray, criterion: str = 'aic', max_features: Optional[int] = None,
+                      workers: Optional[int] = None, names: Optional[list[str]] = None) -> FeatureSelection:
+    """
+    Forward stepwise selection. The candidate columns are kept orthogonalized
+    against the chosen ones (the Q factor grows by one column per step), so
+    the RSS drop of every candidate, (z_j^T r)^2 / z_j^T z_j, comes from one
+    matrix product instead of a refit. Candidate blocks are scored in
+    parallel threads. Runs up to max_features and keeps the step with the
+    lowest criterion.
+    """
+    n, p = X.shape
+    centered_x = np.asfortranarray(X - X.mean(axis=0))
+    residuals = Y - Y.mean(axis=0)
+    rss = np.einsum('ij,ij->j', residuals, residuals)
+    original_norms = np.einsum('ij,ij->j', centered_x, centered_x)
+    max_features = min(p, n - 2) if max_features is None else min(max_features, p, n - 2)
+
+    workers = max(1, min(workers or default_workers(), p))
+    bounds = np.linspace(0, p, workers + 1).astype(int)
+    blocks = [centered_x[:, start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+    available = np.ones(p, dtype=bool)
+    selected, rows = [], [_step_row(0, 'start', None, 0, rss, n)]
+    q = None
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for step in range(1, max_features + 1):
+            scores = list(pool.map(lambda block: _score_block(block, q, residuals), blocks))
+            norms = np.concatenate([score[0] for score in scores])
+            projections = np.vstack([score[1] for score in scores])
+            valid = available & (norms > COLLINEARITY_TOLERANCE * original_norms)
+            if not valid.any():
+                break
+            with np.errstate(divide='ignore', invalid='ignore'):
+                candidate_rss = np.maximum(rss - projections ** 2 / norms[:, None], 0.0)
+            values = information_criterion(candidate_rss, n, step + 1, criterion).sum(axis=1)
+            chosen = int(np.flatnonzero(valid)[np.argmin(values[valid])])
+
+            q = centered_x[:, chosen] / np.sqrt(norms[chosen])
+            residuals = residuals - np.outer(q, q @ residuals)
+            rss = np.einsum('ij,ij->j', residuals, residuals)
+            available[chosen] = False
+            selected.append(chosen)
+            rows.append(_step_row(step, 'add', chosen, step, rss, n))
+
+    best = _best_step(rows, criterion)
+    return FeatureSelection('forward', criterion, selected[:best], _steps_frame(rows, names))
+
+def backward_elimination(X: np.ndarray, Y: np.ndarray, criterion: str = 'aic',
+                         names: Optional[list[str]] = None) -> FeatureSelection:
+    """
+    Backward elimination from the full model. Dropping column j raises the
+    RSS by b_j^2 / [(R^T R)^-1]_jj, read for every column at once from the
+    R factor; the chosen column is then removed with a QR downdate
+    (scipy.linalg.qr_delete) instead of a new factorization.
+    """
+    n, p = X.shape
+    if n < p + 2:
+        raise ValueError(f"Backward elimination needs more rows than columns plus two, got {n} rows and {p} columns.")
+    centered_x = X - X.mean(axis=0)
+    centered_y = Y - Y.mean(axis=0)
+    q, r = linalg.qr(centered_x, mode='economic', check_finite=False)
+    pivots = np.abs(np.diag(r))
+    if pivots.min() <= COLLINEARITY_TOLERANCE * pivots.max():
+        raise ValueError("The X columns are collinear; use forward selection instead.")
+    tss = np.einsum('ij,ij->j', centered_y, centered_y)
+
+    remaining = list(range(p))
+    qty = q.T @ centered_y
+    rss = tss - np.einsum('ij,ij->j', qty, qty)
+    rows = [_step_row(0, 'start', None, p, rss, n)]
+    removed = []
+    for step in range(1, p + 1):
+        r_inv = linalg.solve_triangular(r, np.eye(len(remaining)), check_finite=False)
+        coefficients = r_inv @ qty
+        inverse_diagonal = np.einsum('ij,ij->i', r_inv, r_inv)
+        candidate_rss = rss + coefficients ** 2 / inverse_diagonal[:, None]
+        values = information_criterion(candidate_rss, n, len(remaining), criterion).sum(axis=1)
+        position = int(np.argmin(values))
+
+        removed.append(remaining.pop(position))
+        if remaining:
+            q, r = linalg.qr_delete(q, r, position, which='col', check_finite=False)
+            qty = q.T @ centered_y
+            rss = tss - np.einsum('ij,ij->j', qty, qty)
+        else:
+            rss = tss
+        rows.append(_step_row(step, 'remove', removed[-1], len(remaining), rss, n))
+
+    best = _best_step(rows, criterion)
+    selected = sorted(set(range(p)) - set(removed[:best]))
+    return FeatureSelection('backward', criterion, selected, _steps_frame(rows, names))
+
+def _subset_rss(sxx: np.ndarray, sxy: np.ndarray, syy: np.ndarray, subsets: np.ndarray) -> np.ndarray:
+    """RSS of each response for a batch of equal-size subsets, from the centered cross products."""
+    gram = sxx[subsets[:, :, None], subsets[:, None, :]]
+    targets = sxy[subsets]
+    try:
+        solutions = np.linalg.solve(gram, targets)
+    except np.linalg.LinAlgError:
+        # Algum subconjunto colinear no lote: pseudo-inversa em todos
+        solutions = np.linalg.pinv(gram, hermitian=True) @ targets
+    return syy - np.einsum('bsk,bsk->bk', targets, solutions)
+
+def _best_of_batch(sxx, sxy, syy, subsets, n, criterion) -> tuple[float, np.ndarray, np.ndarray]:
+    rss = _subset_rss(sxx, sxy, syy, subsets)
+    values = information_criterion(np.maximum(rss, 0.0), n, subsets.shape[1] + 1, criterion).sum(axis=1)
+    best = int(np.argmin(values))
+    return values[best], subsets[best], rss[best]
+
+def _subset_batches(p: int, size: int):
+    iterator = combinations(range(p), size)
+    while True:
+        batch = np.array(list(islice(iterator, SUBSET_BATCH)), dtype=int).reshape(-1, size)
+        if not len(batch):
+            return
+        yield batch
+
+def best_subset_selection(X: np.ndarray, Y: np.ndarray, criterion: str = 'aic', max_features: Optional[int] = None,
+                          workers: Optional[int] = None, executor: str = "process",
+                          names: Optional[list[str]] = None) -> FeatureSelection:
+    """
+    Exhaustive search over every subset of up to max_features columns, from
+    the centered cross products (see RegressionStatistics) so each subset
+    costs one small batched solve. Batches of subsets run in parallel in a
+    process pool (or threads). Limited to MAX_SUBSETS subsets.
+    """
+    if executor not in ("process", "thread"):
+        raise ValueError('executor must be "process" or "thread"')
+    n, p = X.shape
+    max_features = min(p, n - 2) if max_features is None else min(max_features, p, n - 2)
+    total = sum(comb(p, size) for size in range(1, max_features + 1))
+    if total > MAX_SUBSETS:
+        raise ValueError(f"{total} subsets exceed the limit of {MAX_SUBSETS}; lower max_features or use forward selection.")
+    statistics = RegressionStatistics().update(X, Y)
+    sxx, sxy, syy = statistics.sxx, statistics.sxy, np.diag(statistics.syy)
+
+    rows = [_step_row(0, 'start', None, 0, syy, n)]
+    subsets_by_size = [[]]
+    workers = workers or default_workers()
+    pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        for size in range(1, max_features + 1):
+            futures = [pool.submit(_best_of_batch, sxx, sxy, syy, batch, n, criterion)
+                       for batch in _subset_batches(p, size)]
+            _, subset, rss = min((future.result() for future in futures), key=lambda result: result[0])
+            subsets_by_size.append(subset.tolist())
+            rows.append(_step_row(size, 'best of size', subset.tolist(), size, rss, n))
+
+    best = _best_step(rows, criterion)
+    return FeatureSelection('best_subset', criterion, subsets_by_size[best], _steps_frame(rows, names))
+
+def select_features(X, Y, method: str = 'forward', criterion: str = 'aic', max_features: Optional[int] = None,
+                    workers: Optional[int] = None, names: Optional[list[str]] = None,
+                    executor: str = "thread") -> FeatureSelection:
+    """
+    Forward, backward or best-subset selection of the X columns by AIC or
+    BIC. With `names`, the steps table shows column names instead of indices.
+    Best-subset batches run in threads unless executor="process" (for
+    scripts; an app would fork a pool on every interaction).
+    """
+    if method not in SELECTION_METHODS:
+        raise ValueError(f"Method must be one of {SELECTION_METHODS}.")
+    if criterion not in CRITERIA:
+        raise ValueError(f"Criterion must be one of {CRITERIA}.")
+    X, Y = np.asarray(X, dtype=np.float64), np.asarray(Y, dtype=np.float64)
+    Y = Y[:, None] if Y.ndim == 1 else Y
+    if X.shape[0] != Y.shape[0]:
+        raise ValueError(f"X and Y must have the same number of rows, got {X.shape[0]} and {Y.shape[0]}.")
+    if X.shape[0] < 3:
+        raise ValueError("At least three rows are needed to select features.")
+    if method == 'forward':
+        return forward_selection(X, Y, criterion, max_features, workers, names)
+    if method == 'backward':
+        return backward_elimination(X, Y, criterion, names)
+    return best_subset_selection(X, Y, criterion, max_features, workers, executor, names)
@@ -0,0 +1,183 @@
+from itertools import product
+from typing import Optional
+import numpy as np
+from .periodicity import autocorrelation, linear_trend
+
+# Grade de parâmetros testada em paralelo para todas as colunas
+ALPHAS = (0.1, 0.3, 0.5, 0.7, 0.9)
+BETAS = (0.01, 0.1, 0.3)
+GAMMAS = (0.05, 0.2, 0.5)
+MAX_AR_ORDER = 10
+
+def _as_2d(data) -> np.ndarray:
+    values = np.asarray(data, dtype=np.float64)
+    if values.ndim not in (1, 2):
+        raise ValueError("Data should be either 1D or 2D.")
+    return values.reshape(values.shape[0], -1)
+
+class HoltWinters:
+    """
+    Additive Holt-Winters exponential smoothing (level, optional trend and
+    optional seasonality of length `period`) for every column at once.
+
+    Fitting runs the smoothing recursion a single time over the series for
+    all columns and every combination of the alpha/beta/gamma grid together,
+    as one array of lanes, and keeps the combination with the lowest sum of
+    squared one-step errors per column. The fitted state (final level, trend
+    and seasonal indices) is kept, so forecasts of any horizon cost O(steps).
+    NaN values are skipped (replaced by the one-step forecast).
+    """
+
+    def __init__(self, period: Optional[int] = None, trend: bool = True,
+                 alphas=ALPHAS, betas=BETAS, gammas=GAMMAS):
+        self.period = period if period and period > 1 else None
+        self.trend = trend
+        self.alphas, self.betas, self.gammas = alphas, betas, gammas
+
+    def _initial_state(self, values: np.ndarray):
+        n, m = values.shape
+        with np.errstate(invalid='ignore'):
+            if self.period:
+                first, second = values[:self.period], values[self.period:2 * self.period]
+                level = np.nanmean(first, axis=0)
+                trend = (np.nanmean(second, axis=0) - level) / self.period
+                season = first - level
+            else:
+                level = values[0]
+                trend = values[1] - values[0]
+                season = np.zeros((1, m))
+        fallback = np.nan_to_num(np.nanmean(values, axis=0)) if np.isnan(values).any() else 0.0
+        level = np.where(np.isnan(level), fallback, level)
+        trend = np.nan_to_num(trend) if self.trend else np.zeros(m)
+        return level, trend, np.nan_to_num(season)
+
+    def fit(self, data) -> 'HoltWinters':
+        values = _as_2d(data)
+        n, m = values.shape
+        minimum = 2 * self.period if self.period else 2
+        if n < minimum:
+            raise ValueError(f"Holt-Winters needs at least {minimum} observations, got {n}.")
+
+        grid = np.array(list(product(self.alphas, self.betas if self.trend else (0.0,),
+                                     self.gammas if self.period else (0.0,))))
+        lanes = (len(grid), m)
+        alpha = grid[:, 0, None]
+        # Forma de correção do erro: cada estado soma um múltiplo do erro de um passo
+        trend_gain = alpha * grid[:, 1, None]
+        season_gain = grid[:, 2, None]
+
+        level0, trend0, season0 = self._initial_state(values)
+        level = np.broadcast_to(level0, lanes).copy()
+        trend = np.broadcast_to(trend0, lanes).copy()
+        season = np.broadcast_to(season0[:, None, :], (len(season0),) + lanes).copy()
+        sse = np.zeros(lanes)
+        error = np.empty(lanes)
+        step = np.empty(lanes)
+        missing = np.isnan(values).any(axis=1)
+
+        period = len(season)
+        for t in range(n):
+            current = season[t % period]
+            np.add(level, trend, out=level)
+            np.add(level, current, out=error)
+            np.subtract(values[t], error, out=error)
+            if missing[t]:
+                np.nan_to_num(error, copy=False)
+            np.multiply(error, error, out=step)
+            sse += step
+            np.multiply(alpha, error, out=step)
+            level += step
+            if self.trend:
+                np.multiply(trend_gain, error, out=step)
+                trend += step
+            if self.period:
+                np.multiply(season_gain, error, out=step)
+                current += step
+
+        best = sse.argmin(axis=0)
+        columns = np.arange(m)
+        self.params = grid[best]
+        self.level = level[best, columns]
+        self.slope = trend[best, columns]
+        self.season = season[:, best, columns]
+        self.mse = sse[best, columns] / n
+        self.n_obs = n
+        return self
+
+    def forecast(self, steps: int) -> np.ndarray:
+        """Forecast of the next `steps` points of every column (steps x columns)."""
+        horizon = np.arange(1, steps + 1)[:, None]
+        seasonal = self.season[(self.n_obs + horizon[:, 0] - 1) % len(self.season)]
+        return self.level + horizon * self.slope + seasonal
+
+def levinson_durbin(acf: np.ndarray, max_order: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Yule-Walker AR coefficients of every order up to `max_order`, for every
+    column, from autocorrelations (lags x columns) with the Levinson-Durbin
+    recursion. Returns coefficients (orders + 1, columns, max_order), zero
+    past each order, and the relative innovation variances (orders + 1, columns).
+    """
+    m = acf.shape[1]
+    coefficients = np.zeros((max_order + 1, m, max_order))
+    variances = np.ones((max_order + 1, m))
+    phi = np.zeros((m, max_order))
+    for k in range(1, max_order + 1):
+        previous = phi[:, :k - 1]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            reflection = (acf[k] - (previous * acf[k - 1:0:-1].T).sum(axis=1)) / variances[k - 1]
+        reflection = np.nan_to_num(np.clip(reflection, -1.0, 1.0))
+        phi[:, :k - 1] = previous - reflection[:, None] * previous[:, ::-1]
+        phi[:, k - 1] = reflection
+        variances[k] = variances[k - 1] * (1 - reflection ** 2)
+        coefficients[k] = phi
+    return coefficients, variances
+
+class AutoRegressive:
+    """
+    Autoregressive model around a linear trend for every column at once.
+
+    The autocorrelations of the detrended columns come from one FFT, and the
+    Levinson-Durbin recursion gives the Yule-Walker coefficients of every
+    order up to `max_order` in the same pass; each column keeps the order
+    with the lowest AIC, or the fixed `order`. The fitted state is the trend
+    line, the coefficients and the last residuals.
+    """
+
+    def __init__(self, max_order: int = MAX_AR_ORDER, order: Optional[int] = None):
+        self.max_order = order if order is not None else max_order
+        self.fixed_order = order is not None
+
+    def fit(self, data) -> 'AutoRegressive':
+        values, intercept, slope = linear_trend(_as_2d(data))
+        n, m = values.shape
+        if n <= self.max_order + 1:
+            raise ValueError(f"An AR model of order {self.max_order} needs more than {self.max_order + 1} observations, got {n}.")
+
+        acf = np.nan_to_num(autocorrelation(values)[:self.max_order + 1])
+        coefficients, variances = levinson_durbin(acf, self.max_order)
+        if self.fixed_order:
+            self.order = np.full(m, self.max_order)
+        else:
+            orders = np.arange(self.max_order + 1)[:, None]
+            with np.errstate(divide='ignore'):
+                aic = n * np.log(variances) + 2 * orders
+            self.order = np.where(np.isfinite(aic), aic, np.inf).argmin(axis=0)
+        self.coefficients = coefficients[self.order, np.arange(m)]
+
+        time = np.arange(n, dtype=np.float64)[:, None]
+        residuals = np.nan_to_num(values - (intercept + slope * time))
+        self.intercept, self.slope = intercept, slope
+        self.history = residuals[n - self.max_order:]
+        self.n_obs = n
+        return self
+
+    def forecast(self, steps: int) -> np.ndarray:
+        """Forecast of the next `steps` points of every column (steps x columns)."""
+        lags = self.max_order
+        residuals = np.vstack((self.history, np.zeros((steps, self.history.shape[1]))))
+        for step in range(steps):
+            # Coeficiente j multiplica o resíduo j + 1 passos atrás
+            recent = residuals[step:step + lags][::-1]
+            residuals[lags + step] = np.einsum('mj,jm->m', self.coefficients, recent)
+        time = np.arange(self.n_obs, self.n_obs + steps, dtype=np.float64)[:, None]
+        return self.intercept + self.slope * time + residuals[lags:]
@@ -0,0 +1,147 @@
+from typing import Optional
+import numpy as np
+from scipy import linalg
+
+SOLVERS = ('auto', 'qr', 'cholesky', 'lstsq')
+# Acima deste número de condição de X, a matriz normal (cond ao quadrado) perde precisão demais
+CHOLESKY_CONDITION_LIMIT = 1e6
+# Pivôs de R menores que isto (relativos ao maior) indicam colunas dependentes
+RANK_TOLERANCE = 1e-10
+# Linhas por bloco na QR em árvore (TSQR): cada bloco cabe no cache
+QR_BLOCK_ROWS = 8192
+
+class LeastSquaresSolution:
+    """
+    Coefficients of a least-squares fit (predictors x responses) and the
+    factorization behind them, kept so that (X^T X)^-1 and other quantities
+    can be derived later without refactoring X.
+    """
+
+    def __init__(self, coefficients: np.ndarray, method: str, rank: int, n_samples: int,
+                 r: Optional[np.ndarray] = None, cholesky: Optional[tuple] = None, svd: Optional[tuple] = None,
+                 xtx_inv: Optional[np.ndarray] = None):
+        self.coefficients = coefficients
+        self.method = method
+        self.rank = rank
+        self.n_samples = n_samples
+        self._r = r
+        self._cholesky = cholesky
+        self._svd = svd
+        self._xtx_inv = xtx_inv
+
+    @property
+    def xtx_inv(self) -> Optional[np.ndarray]:
+        """
+        (X^T X)^-1 from the stored factor (pseudo-inverse if X is rank
+        deficient), or None when the fit has no factor (penalized fits).
+        """
+        if self._xtx_inv is None:
+            if self._cholesky is not None:
+                identity = np.eye(self._cholesky[0].shape[0])
+                self._xtx_inv = linalg.cho_solve(self._cholesky, identity)
+            elif self._r is not None:
+                r_inv = linalg.solve_triangular(self._r, np.eye(self._r.shape[0]))
+                self._xtx_inv = r_inv @ r_inv.T
+            elif self._svd is not None:
+                singular, vt = self._svd
+                kept = vt[:self.rank]
+                self._xtx_inv = (kept.T / singular[:self.rank] ** 2) @ kept
+        return self._xtx_inv
+
+def _as_2d(array: np.ndarray) -> np.ndarray:
+    array = np.asarray(array, dtype=np.float64)
+    return array[:, None] if array.ndim == 1 else array
+
+def solve_qr(X: np.ndarray, Y: np.ndarray) -> LeastSquaresSolution:
+    """
+    Householder QR of [X | Y]: the R factor of the augmented matrix holds
+    both R and Q^T Y, so Q is never formed. Tall inputs are factored block
+    by block (TSQR). Falls back to lstsq if X is rank deficient.
+    """
+    n, p = X.shape
+    if n < p:
+        return solve_lstsq(X, Y)
+    width = p + Y.shape[1]
+    if n > 2 * QR_BLOCK_ROWS:
+        # QR de cada bloco de linhas e depois dos fatores R empilhados: mesmo R, sem copiar [X | Y] inteira
+        blocks = [linalg.qr(np.hstack((X[start:start + QR_BLOCK_ROWS], Y[start:start + QR_BLOCK_ROWS])),
+                            mode='r', check_finite=False)[0][:width] for start in range(0, n, QR_BLOCK_ROWS)]
+        r = linalg.qr(np.vstack(blocks), mode='r', check_finite=False)[0]
+    else:
+        r = linalg.qr(np.hstack((X, Y)), mode='r', check_finite=False)[0]
+    r_x, qty = r[:p, :p], r[:p, p:]
+    pivots = np.abs(np.diag(r_x))
+    if pivots.min() <= RANK_TOLERANCE * pivots.max():
+        return solve_lstsq(X, Y)
+    coefficients = linalg.solve_triangular(r_x, qty, check_finite=False)
+    return LeastSquaresSolution(coefficients, 'qr', p, n, r=r_x)
+
+def solve_cholesky(X: np.ndarray, Y: np.ndarray, gram: Optional[np.ndarray] = None) -> LeastSquaresSolution:
+    """
+    Normal equations solved with a Cholesky factor of X^T X: the fastest
+    backend for tall, well-conditioned designs (n p^2 / 2 flops). Falls back
+    to QR if X^T X is not positive definite or is only numerically so: a
+    rank-deficient X often still factors because of rounding, leaving
+    pivots near sqrt(eps) that would blow up the standard errors.
+    """
+    n, p = X.shape
+    gram = X.T @ X if gram is None else gram
+    try:
+        factor = linalg.cho_factor(gram, check_finite=False)
+    except linalg.LinAlgError:
+        return solve_qr(X, Y)
+    # Pivô relativo ao quadrado (escala de X^T X): parte de cada coluna fora do espaço das anteriores
+    with np.errstate(invalid='ignore', divide='ignore'):
+        relative_pivots = np.diag(factor[0]) ** 2 / np.diag(gram)
+    if not relative_pivots.min() > RANK_TOLERANCE:
+        return solve_qr(X, Y)
+    coefficients = linalg.cho_solve(factor, X.T @ Y, check_finite=False)
+    return LeastSquaresSolution(coefficients, 'cholesky', p, n, cholesky=factor)
+
+def solve_lstsq(X: np.ndarray, Y: np.ndarray) -> LeastSquaresSolution:
+    """SVD-based minimum-norm solution: handles wide and rank-deficient designs."""
+    n, p = X.shape
+    u, singular, vt = linalg.svd(X, full_matrices=False, check_finite=False)
+    rank = int((singular > RANK_TOLERANCE * singular.max()).sum()) if singular.size else 0
+    coefficients = vt[:rank].T @ ((u[:, :rank].T @ Y) / singular[:rank, None])
+    return LeastSquaresSolution(coefficients, 'lstsq', rank, n, svd=(singular, vt))
+
+def choose_solver(X: np.ndarray) -> tuple[str, Optional[np.ndarray]]:
+    """
+    Backend for a design matrix: lstsq for wide designs, Cholesky when the
+    column-scaled X^T X shows X is well conditioned, QR otherwise. Returns
+    the Gram matrix too, so Cholesky does not recompute it.
+    """
+    n, p = X.shape
+    if n < p:
+        return 'lstsq', None
+    gram = X.T @ X
+    scale = np.sqrt(np.diag(gram))
+    if not np.all(scale > 0):
+        return 'lstsq', None
+    # Escalar as colunas remove a parte do mau condicionamento que vem só das unidades
+    condition = np.linalg.cond(gram / np.outer(scale, scale))
+    if np.sqrt(condition) < CHOLESKY_CONDITION_LIMIT:
+        return 'cholesky', gram
+    return 'qr', None
+
+def solve_least_squares(X, Y, method: str = 'auto') -> LeastSquaresSolution:
+    """
+    Least-squares coefficients for every column of Y with one factorization
+    of X. `method` is 'qr', 'cholesky', 'lstsq' or 'auto' (see choose_solver).
+    """
+    if method not in SOLVERS:
+        raise ValueError(f"Method must be one of {SOLVERS}.")
+    X, Y = _as_2d(X), _as_2d(Y)
+    if X.shape[0] != Y.shape[0]:
+        raise ValueError(f"X and Y must have the same number of rows, got {X.shape[0]} and {Y.shape[0]}.")
+    if not (np.all(np.isfinite(X)) and np.all(np.isfinite(Y))):
+        raise ValueError("X and Y must not contain NaN or infinite values.")
+    gram = None
+    if method == 'auto':
+        method, gram = choose_solver(X)
+    if method == 'cholesky':
+        return solve_cholesky(X, Y, gram)
+    if method == 'qr':
+        return solve_qr(X, Y)
+    return solve_lstsq(X, Y)
@@ -0,0 +1,43 @@
+import re
+from typing import Optional
+import pandas as pd
+
+URL_PATTERN = re.compile(r'(?:http|https|www)\S*')
+# Linhas verificadas por vez antes de decidir se vale olhar o resto da coluna
+BLOCK_SIZE = 4096
+
+def contains_link(series: pd.Series) -> pd.Series:
+    """Verifica, célula a célula, se uma série contém links."""
+    return series.astype(str).str.contains(URL_PATTERN, regex=True)
+
+def column_has_link(series: pd.Series, sample_size: Optional[int] = None) -> bool:
+    """
+    Whether any cell of the column contains a link.
+
+    Numeric, boolean and datetime columns are skipped without looking at the
+    values. The distinct values of text columns are scanned in blocks with
+    the compiled pattern and the scan stops at the first block with a match.
+    With `sample_size`, only that many evenly spaced cells of a longer column
+    are inspected.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Basta olhar as categorias distintas
+        series = pd.Series(series.cat.categories)
+    if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+        return False
+    values = series.dropna()
+    if sample_size is not None and len(values) > sample_size:
+        step = len(values) // sample_size
+        values = values.iloc[::step]
+    # Valores repetidos só precisam ser verificados uma vez
+    values = pd.Series(pd.unique(values.to_numpy()))
+    for start in range(0, len(values), BLOCK_SIZE):
+        block = values.iloc[start:start + BLOCK_SIZE].astype(str)
+        if block.str.contains(URL_PATTERN, regex=True).any():
+            return True
+    return False
+
+def filter_columns_with_links(df: pd.DataFrame, sample_size: Optional[int] = None):
+    """Remove colunas que contêm links."""
+    columns_with_links = [col for col in df.columns if column_has_link(df[col], sample_size)]
+    return df.drop(columns=columns_with_links), columns_with_links
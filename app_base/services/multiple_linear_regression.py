@@ -2,6 +2,11 @@ import numpy as np
 import matplotlib.pyplot as plt
 import scipy.stats as stats
 from .table_class import Table
+from .linear_solvers import LeastSquaresSolution, solve_least_squares
+from .regularization import PENALTIES, cross_validate, regularization_path
+from .feature_selection import select_features
+from .streaming_regression import accumulate_statistics
+from .regression_fit import RegressionFit
 
 class MultipleLinearRegression:
     def __init__(self, X: np.array, Y: np.array):
@@ -15,38 +20,134 @@ class MultipleLinearRegression:
         self.Y = Y
         self.coefficients = None
         self.intercept = None
+        self.solution = None
+        self.statistics = None
+        self.result = None
+        self.path = self.cross_validation = None
+        self.alpha = None
+        self.selection = None
+        self.columns_x = self.columns_y = None
         self.fitted = False
         self.errors = None
         self.squared_errors = None
 
-    def fit(self):
-        try:
-            # Adiciona uma coluna de uns para o intercepto
-            X_with_intercept = np.hstack((np.ones((self.X.shape[0], 1)), self.X))
-            # Ajusta Y se necessário para que tenha a mesma quantidade de linhas de X
-            if X_with_intercept.shape[0] != self.Y.shape[0]:
-                min_len = min(X_with_intercept.shape[0], self.Y.shape[0])
-                X_with_intercept = X_with_intercept[:min_len, :]
-                self.Y = self.Y[:min_len, :]
-            self.coefficients = np.linalg.pinv(X_with_intercept.T @ X_with_intercept) @ X_with_intercept.T @ self.Y
-            self.intercept = self.coefficients[0]
-            self.coefficients = self.coefficients[1:]
-            self.fitted = True
-        except Exception as e:
-            print(f"Error during fitting: {e}")
+    def fit(self, method: str = 'auto'):
+        """
+        Fit the coefficients of every response column with one factorization
+        of the design matrix (see services.linear_solvers for the methods).
+        """
+        if self.X.shape[0] != self.Y.shape[0]:
+            raise ValueError(f"X and Y must have the same number of rows, got {self.X.shape[0]} and {self.Y.shape[0]}.")
+        # Adiciona uma coluna de uns para o intercepto
+        X_with_intercept = np.hstack((np.ones((self.X.shape[0], 1)), self.X))
+        self.solution = solve_least_squares(X_with_intercept, self.Y, method)
+        self._set_result(RegressionFit(self.solution, self.X, self.Y))
+
+    def fit_regularized(self, penalty: str = 'ridge', alpha=None, l1_ratio: float = 0.5, folds: int = 5,
+                        workers=None, executor: str = "thread"):
+        """
+        Ridge, lasso or elastic-net fit (see services.regularization). Without
+        `alpha`, k-fold cross-validation over the regularization path picks
+        the best alpha of each response, with the folds fitted in parallel
+        threads by default; executor="process" suits scripts and benchmarks,
+        not an app that refits on every interaction. The full path is kept in `self.path` and the validation errors in
+        `self.cross_validation`.
+        """
+        if penalty not in PENALTIES:
+            raise ValueError(f"Penalty must be one of {PENALTIES}.")
+        if self.X.shape[0] != self.Y.shape[0]:
+            raise ValueError(f"X and Y must have the same number of rows, got {self.X.shape[0]} and {self.Y.shape[0]}.")
+        l1_ratio = {'ridge': 0.0, 'lasso': 1.0}.get(penalty, l1_ratio)
+        k = self.Y.shape[1]
+        if alpha is None:
+            self.cross_validation = cross_validate(self.X, self.Y, l1_ratio, folds=folds, workers=workers,
+                                                   executor=executor)
+            alphas, best = self.cross_validation.alphas, self.cross_validation.best_index
+        else:
+            self.cross_validation = None
+            alphas, best = np.atleast_1d(np.asarray(alpha, dtype=np.float64)), np.zeros(k, dtype=int)
+        # Um único caminho (com warm starts) para todos os alphas; cada resposta fica com o seu
+        self.path = regularization_path(self.X, self.Y, l1_ratio, alphas)
+        responses = np.arange(k)
+        slopes = self.path.coefficients[best, :, responses].T
+        intercept = self.path.intercepts[best, responses]
+        self.alpha = self.path.alphas[best]
+
+        # Graus de liberdade: coeficientes não nulos mais o intercepto (o maior entre as respostas)
+        rank = int((slopes != 0).sum(axis=0).max()) + 1
+        self.solution = LeastSquaresSolution(np.vstack((intercept, slopes)), penalty, rank, self.X.shape[0])
+        self._set_result(RegressionFit(self.solution, self.X, self.Y))
+
+    def fit_selected(self, method: str = 'forward', criterion: str = 'aic', max_features=None, workers=None,
+                     executor: str = "thread"):
+        """
+        Choose the X columns with forward, backward or best-subset selection
+        by AIC or BIC (see services.feature_selection) and fit OLS on them.
+        X and columns_x are narrowed to the chosen columns; the search, with
+        its per-step RSS, AIC and BIC, is kept in `self.selection`.
+        """
+        selection = select_features(self.X, self.Y, method, criterion, max_features, workers, self.columns_x, executor)
+        if not selection.selected:
+            raise ValueError(f"No X column improves the {criterion.upper()} of the intercept-only model.")
+        if self.columns_x is not None:
+            self.columns_x = [self.columns_x[i] for i in selection.selected]
+        self.X = self.X[:, selection.selected]
+        self.selection = selection
+        self.fit()
+
+    def _set_result(self, result: RegressionFit):
+        # Previsões, resíduos e estatísticas calculados uma vez e reaproveitados por gráficos e relatórios
+        self.result = result
+        self.intercept = result.coefficients[0]
+        self.coefficients = result.coefficients[1:]
+        self.errors = result.residuals
+        self.squared_errors = result.squared_errors
+        self.std_dev_error = result.std_dev_error
+        self.fitted = True
+
+    @classmethod
+    def fit_streaming(cls, chunks, workers: int = 1) -> 'MultipleLinearRegression':
+        """
+        Fit from an iterable of (X, Y) row chunks (e.g. array_chunks over
+        memory-mapped arrays or frame_regression_chunks over a CSV reader)
+        with memory bounded by the chunk size, through the regression's
+        sufficient statistics (see services.streaming_regression). The
+        returned model keeps the statistics instead of X and Y.
+        """
+        statistics = accumulate_statistics(chunks, workers)
+        if not statistics.n:
+            raise ValueError("No data to fit.")
+        model = cls(X=np.empty((0, statistics.sxx.shape[0])), Y=np.empty((0, statistics.syy.shape[0])))
+        model.statistics = statistics
+        model.solution = statistics.solve()
+        model._set_result(RegressionFit(model.solution, statistics=statistics))
+        return model
 
     def predict(self, X_new):
         if not self.fitted:
             raise ValueError("The model has not been fitted yet.")
         
-        X_new_with_intercept = np.hstack((np.ones((X_new.shape[0], 1)), X_new))
-        return X_new_with_intercept @ np.vstack([self.intercept, self.coefficients])
+        return X_new @ self.coefficients + self.intercept
 
     def calculate_errors(self):
-        predictions = self.predict(self.X)
-        self.errors = self.Y - predictions
-        self.squared_errors = self.errors ** 2
-        self.std_dev_error = np.std(self.errors, axis=0)
+        """Residuals of the fit, served from the result computed at fit time."""
+        if not self.fitted:
+            raise ValueError("The model has not been fitted yet.")
+        if self.result.residuals is None:
+            raise ValueError("Residuals need the in-memory X and Y; this model was fitted from streamed chunks.")
+        self.errors = self.result.residuals
+        self.squared_errors = self.result.squared_errors
+        self.std_dev_error = self.result.std_dev_error
+
+    def summary(self):
+        """R², adjusted R² and the coefficient table (standard errors, t-statistics and p-values)."""
+        if not self.fitted:
+            raise ValueError("The model has not been fitted yet.")
+        return {
+            'r_squared': self.result.r_squared,
+            'adjusted_r_squared': self.result.adjusted_r_squared,
+            'coefficients': self.result.summary(self.columns_x, self.columns_y)
+        }
 
     def plot(self, return_fig=False):
         """
@@ -55,10 +156,9 @@ class MultipleLinearRegression:
         if not self.fitted:
             raise ValueError("The model must be fitted before plotting.")
         
-        predictions = self.predict(self.X)
-        min_len = min(predictions.shape[0], self.Y.shape[0])
-        predictions = predictions[:min_len]
-        actual = self.Y[:min_len]
+        self.calculate_errors()
+        predictions = self.result.predictions
+        actual = self.Y
 
         fig, ax = plt.subplots(figsize=(10, 5))
         ax.plot(actual, label='Actual', marker='o')
@@ -143,6 +243,8 @@ class MultipleLinearRegression:
             raise ValueError("All columns in X must be numeric.")
         if not all([column in table.numeric_columns for column in columns_y]):
             raise ValueError("All columns in Y must be numeric.")
-        x = np.array([table.column_dict[column].values for column in columns_x]).T
-        y = np.array([table.column_dict[column].values for column in columns_y]).T
-        return cls(X=x, Y=y)
+        x = table.to_array(columns_x)
+        y = table.to_array(columns_y)
+        model = cls(X=x, Y=y)
+        model.columns_x, model.columns_y = list(columns_x), list(columns_y)
+        return model
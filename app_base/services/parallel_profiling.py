@@ -0,0 +1,91 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+import os
+import numpy as np
+import pandas as pd
+from .column_stats import ColumnProfile, compute_column_stats, content_fingerprint, store_profile
+from .table_class import Column
+from .type_inference import InferredColumn, infer_column_type
+
+# Abaixo deste número de células o custo de criar o pool supera o ganho
+PARALLEL_MIN_CELLS = 1_000_000
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+def _profile(values: np.ndarray) -> tuple[InferredColumn, ColumnProfile]:
+    inferred = infer_column_type(values)
+    profile = ColumnProfile(fingerprint=content_fingerprint(inferred.values, inferred.value_type),
+                            value_type=inferred.value_type,
+                            stats=compute_column_stats(inferred.values, inferred.null_mask, inferred.value_type))
+    return inferred, profile
+
+def _profile_shared(shm_name: str, shape: tuple, dtype: str) -> ColumnProfile:
+    """Profile a numeric column that the parent process placed in shared memory."""
+    shm = SharedMemory(name=shm_name)
+    try:
+        values = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        profile = _profile(values)[1]
+        del values
+        return profile
+    finally:
+        shm.close()
+
+def _build_column(name, values: np.ndarray) -> Column:
+    column = Column(name=name, values=values)
+    column.profile
+    return column
+
+def _profile_in_processes(df: pd.DataFrame, workers: int) -> list[Column]:
+    segments = []
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = []
+            for name in df.columns:
+                values = df[name].to_numpy()
+                if values.dtype.kind in 'iuf' and values.size:
+                    # Colunas numéricas vão por memória compartilhada, sem serializar os dados
+                    shm = SharedMemory(create=True, size=values.nbytes)
+                    segments.append(shm)
+                    np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+                    futures.append((name, values, pool.submit(_profile_shared, shm.name, values.shape, values.dtype.str)))
+                else:
+                    futures.append((name, values, pool.submit(_profile, values)))
+
+            columns = []
+            for name, values, future in futures:
+                result = future.result()
+                if isinstance(result, ColumnProfile):
+                    # Inferir o tipo de um array numérico só olha o dtype (e os NaN)
+                    inferred, profile = infer_column_type(values), result
+                else:
+                    inferred, profile = result
+                store_profile(profile)
+                columns.append(Column.from_inferred(name, inferred, profile))
+            return columns
+    finally:
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+def profile_dataframe(df: pd.DataFrame, workers: Optional[int] = None, executor: str = "process") -> list[Column]:
+    """
+    Build and profile the Columns of a DataFrame across a pool of workers.
+
+    With executor="process", numeric columns are copied once into shared
+    memory and only their profiles travel back; text columns are sent to
+    the workers as arrays. executor="thread" profiles columns in threads
+    sharing the DataFrame buffers. Inputs under PARALLEL_MIN_CELLS cells,
+    or a single worker, are profiled serially.
+    """
+    if executor not in ("process", "thread"):
+        raise ValueError('executor must be "process" or "thread"')
+    workers = workers or default_workers()
+    if workers <= 1 or df.size < PARALLEL_MIN_CELLS or len(df.columns) < 2:
+        return [_build_column(name, df[name].to_numpy()) for name in df.columns]
+    workers = min(workers, len(df.columns))
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda name: _build_column(name, df[name].to_numpy()), df.columns))
+    return _profile_in_processes(df, workers)
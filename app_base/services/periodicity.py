@@ -0,0 +1,128 @@
+from typing import Optional
+import numpy as np
+from scipy import fft
+
+# Picos do periodograma examinados, em ordem de potência
+CANDIDATE_PEAKS = 5
+# Um pico com período múltiplo do escolhido o substitui (era um harmônico) se a ACF for maior por esta margem
+HARMONIC_MARGIN = 0.1
+# Desvio relativo admitido na razão entre as frequências de um pico e de seu harmônico
+HARMONIC_TOLERANCE = 0.1
+
+def linear_trend(data) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Least-squares line a + b * t of every column, ignoring NaN values.
+    Returns the data as a 2-D array with the intercepts and slopes (zero for
+    columns with fewer than two values).
+    """
+    values = np.asarray(data, dtype=np.float64)
+    values = values.reshape(values.shape[0], -1)
+    valid = ~np.isnan(values)
+    time = np.where(valid, np.arange(values.shape[0], dtype=np.float64)[:, None], 0.0)
+    filled = np.where(valid, values, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        counts = valid.sum(axis=0)
+        time_mean, value_mean = time.sum(axis=0) / counts, filled.sum(axis=0) / counts
+        centered_time = np.where(valid, time - time_mean, 0.0)
+        slope = (centered_time * filled).sum(axis=0) / (centered_time ** 2).sum(axis=0)
+    slope, value_mean = np.nan_to_num(slope), np.nan_to_num(value_mean)
+    return values, value_mean - slope * np.nan_to_num(time_mean), slope
+
+def _detrended(data) -> np.ndarray:
+    """Columns minus their least-squares line, with NaN gaps set to zero."""
+    values, intercept, slope = linear_trend(data)
+    line = intercept + slope * np.arange(values.shape[0], dtype=np.float64)[:, None]
+    return np.where(np.isnan(values), 0.0, values - line)
+
+def periodogram(data) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Frequencies (cycles per sample) and power spectrum of every column of a
+    1-D or 2-D series, from one real FFT along the time axis: O(n log n).
+    A linear trend is removed first so it does not mask the cycles.
+    """
+    values = _detrended(data)
+    n = values.shape[0]
+    power = np.abs(fft.rfft(values, axis=0)) ** 2 / n
+    return fft.rfftfreq(n), power
+
+def autocorrelation(data) -> np.ndarray:
+    """
+    Autocorrelation of every (linearly detrended) column for lags 0 .. n-1,
+    computed through the FFT (Wiener-Khinchin) instead of O(n^2) lagged
+    products. Constant columns are NaN.
+    """
+    values = _detrended(data)
+    n = values.shape[0]
+    # Zero padding evita a correlação circular
+    size = fft.next_fast_len(2 * n - 1, real=True)
+    spectrum = fft.rfft(values, size, axis=0)
+    acf = fft.irfft(spectrum * np.conj(spectrum), size, axis=0)[:n]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return acf / acf[0]
+
+def estimate_period(frequencies: np.ndarray, power: np.ndarray, acf: np.ndarray,
+                    min_period: int = 2, max_period: Optional[int] = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Dominant period of each column and its autocorrelation (the strength of the cycle).
+
+    The strongest periodogram peaks between `min_period` and `max_period`
+    (default: half the series, so decomposition sees two cycles) are taken
+    in order of power. Inside the frequency bin of each peak, the lag with
+    the highest autocorrelation refines it to a whole number of samples; a
+    peak is confirmed only if that lag lies past the first zero crossing of
+    the autocorrelation (before it, the ACF measures smoothness, not a
+    cycle) and is positive. The most powerful confirmed peak wins, unless a
+    multiple of its period among the peaks is clearly more autocorrelated,
+    which means it was a harmonic of the fundamental. Columns with no
+    confirmed peak get period 0 and strength NaN.
+    """
+    n, m = acf.shape
+    max_period = n // 2 if max_period is None else min(max_period, n // 2)
+    periods = np.zeros(m, dtype=int)
+    strengths = np.full(m, np.nan)
+
+    # Índices k do periodograma cujo período n / k está no intervalo pedido
+    bins = np.arange(len(frequencies))
+    admissible = (bins > 0) & (bins * max_period >= n) & (bins * min_period <= n)
+    if max_period < min_period or not admissible.any():
+        return periods, strengths
+    candidates = min(CANDIDATE_PEAKS, int(admissible.sum()))
+    # Só máximos locais: os bins vizinhos de um pico forte (vazamento) não contam como outros picos
+    padded = np.pad(power, ((1, 1), (0, 0)), constant_values=-np.inf)
+    local = (power >= padded[:-2]) & (power >= padded[2:])
+    masked = np.where(admissible[:, None] & local, power, -np.inf)
+    # Picos em ordem decrescente de potência
+    peaks = np.argsort(-masked, axis=0)[:candidates]
+
+    # Faixa de defasagens coberta por cada pico: entre os períodos dos bins vizinhos
+    lower = np.maximum(np.floor(n / (peaks + 1)), min_period).astype(int)
+    upper = np.minimum(np.ceil(n / np.maximum(peaks - 1, 1)), max_period).astype(int)
+    below = acf[1:] <= 0
+    first_zero = np.where(below.any(axis=0), below.argmax(axis=0) + 1, n)
+    lower = np.maximum(lower, first_zero + 1)
+    widths = upper - lower + 1
+    lags = lower[..., None] + np.arange(max(int(widths.max()), 1))
+    inside = lags <= upper[..., None]
+    lags = np.minimum(lags, upper[..., None])
+    values = acf[lags, np.arange(m)[:, None]]
+    # Dentro de um bin, compara sem o viés (n - lag) / n, que puxaria o máximo para defasagens menores
+    scores = np.where(inside & ~np.isnan(values), values * n / (n - lags), -np.inf)
+    refined = np.take_along_axis(lags, scores.argmax(axis=2)[..., None], axis=2)[..., 0]
+    confirmed = np.isfinite(scores.max(axis=2))
+    heights = np.where(confirmed, acf[refined, np.arange(m)], -np.inf)
+    confirmed &= heights > 0
+
+    for column in range(m):
+        order = np.flatnonzero(confirmed[:, column])
+        if not len(order):
+            continue
+        best = order[0]
+        for other in order[1:]:
+            # Razão entre as frequências dos picos: o período refinado de um harmônico é grosseiro demais
+            ratio = peaks[best, column] / peaks[other, column]
+            multiple = round(ratio) >= 2 and abs(ratio - round(ratio)) <= HARMONIC_TOLERANCE * round(ratio)
+            if multiple and heights[other, column] > heights[best, column] + HARMONIC_MARGIN:
+                best = other
+        periods[column] = refined[best, column]
+        strengths[column] = heights[best, column]
+    return periods, strengths
@@ -0,0 +1,86 @@
+from typing import Optional
+import numpy as np
+import pandas as pd
+import scipy.stats as stats
+from .linear_solvers import LeastSquaresSolution
+from .streaming_regression import RegressionStatistics
+
+CRITERIA_PENALTIES = {'aic': lambda n: 2.0, 'bic': np.log}
+
+def information_criterion(rss, n_samples: int, n_parameters: int, criterion: str = 'aic'):
+    """AIC or BIC of Gaussian linear fits (up to a constant) from their residual sums of squares."""
+    with np.errstate(divide='ignore'):
+        return n_samples * np.log(np.asarray(rss) / n_samples) + CRITERIA_PENALTIES[criterion](n_samples) * n_parameters
+
+class RegressionFit:
+    """
+    Everything derived from a fitted linear regression with intercept,
+    computed once at fit time: predictions, residuals, squared errors, R²,
+    adjusted R², coefficient standard errors, t-statistics and p-values.
+
+    Standard errors reuse (X^T X)^-1 from the factorization of the fit, so
+    nothing is refactored; penalized fits carry no factor and report NaN. From in-memory X and Y every quantity is
+    available; from streamed sufficient statistics, the per-row predictions
+    and residuals are not (they would need the data again).
+    """
+
+    def __init__(self, solution: LeastSquaresSolution, X: Optional[np.ndarray] = None, Y: Optional[np.ndarray] = None,
+                 statistics: Optional[RegressionStatistics] = None):
+        self.coefficients = solution.coefficients
+        self.n_samples = solution.n_samples
+        # Parâmetros estimados, contando o intercepto
+        self.n_parameters = solution.rank
+        self.df_residual = self.n_samples - self.n_parameters
+        slopes, intercept = self.coefficients[1:], self.coefficients[0]
+
+        if X is not None:
+            self.predictions = X @ slopes + intercept
+            self.residuals = Y - self.predictions
+            self.squared_errors = self.residuals ** 2
+            self.rss = self.squared_errors.sum(axis=0)
+            self.tss = ((Y - Y.mean(axis=0)) ** 2).sum(axis=0)
+            self.std_dev_error = np.std(self.residuals, axis=0)
+        elif statistics is not None:
+            self.predictions = self.residuals = self.squared_errors = None
+            self.rss = np.maximum(statistics.residual_sum_of_squares(slopes), 0.0)
+            self.tss = np.diag(statistics.syy).copy()
+            # Resíduos têm média zero com intercepto: desvio padrão populacional a partir da RSS
+            self.std_dev_error = np.sqrt(self.rss / self.n_samples)
+        else:
+            raise ValueError("Either X and Y or the regression statistics are required.")
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.r_squared = 1 - self.rss / self.tss
+            self.adjusted_r_squared = 1 - (1 - self.r_squared) * (self.n_samples - 1) / self.df_residual
+            self.residual_variance = self.rss / self.df_residual
+            xtx_inv = solution.xtx_inv
+            # Ajustes penalizados não têm erros padrão de mínimos quadrados
+            self.std_errors = np.sqrt(np.outer(np.diag(xtx_inv), self.residual_variance)) if xtx_inv is not None \
+                else np.full_like(self.coefficients, np.nan)
+            self.t_values = self.coefficients / self.std_errors
+        self.p_values = 2 * stats.t.sf(np.abs(self.t_values), self.df_residual) if self.df_residual > 0 \
+            else np.full_like(self.t_values, np.nan)
+
+    @property
+    def aic(self) -> np.ndarray:
+        """Akaike information criterion of each response (Gaussian likelihood, up to a constant)."""
+        return information_criterion(self.rss, self.n_samples, self.n_parameters, 'aic')
+
+    @property
+    def bic(self) -> np.ndarray:
+        """Bayesian information criterion of each response (up to a constant)."""
+        return information_criterion(self.rss, self.n_samples, self.n_parameters, 'bic')
+
+    def summary(self, names_x: Optional[list[str]] = None, names_y: Optional[list[str]] = None) -> pd.DataFrame:
+        """Coefficient table (estimate, standard error, t, p-value) of every response, one row per term."""
+        p, k = self.coefficients.shape
+        names_x = ['intercept'] + (names_x or [f'x{i}' for i in range(p - 1)])
+        names_y = names_y or [f'y{i}' for i in range(k)]
+        return pd.DataFrame({
+            'response': np.repeat(names_y, p),
+            'term': names_x * k,
+            'coefficient': self.coefficients.T.ravel(),
+            'std_error': self.std_errors.T.ravel(),
+            't': self.t_values.T.ravel(),
+            'p_value': self.p_values.T.ravel()
+        })
@@ -0,0 +1,207 @@
+from typing import Iterable, Iterator, Optional
+import numpy as np
+import pandas as pd
+
+AGGREGATIONS = ('mean', 'sum', 'last', 'count')
+FILL_METHODS = (None, 'ffill', 'interpolate')
+# Linhas lidas por vez de arrays mapeados em memória
+CHUNK_ROWS = 1 << 20
+DAY_NANOSECONDS = 86_400 * 10 ** 9
+
+def _as_ticks(timestamps, interval, origin):
+    """Timestamps, interval and origin as plain numbers (datetimes become int64 nanoseconds)."""
+    timestamps = np.asarray(timestamps)
+    if timestamps.dtype.kind == 'M':
+        interval = pd.Timedelta(interval).value
+        origin = None if origin is None else pd.Timestamp(origin).value
+        return timestamps.astype('datetime64[ns]').view(np.int64), interval, origin, True
+    if timestamps.dtype.kind not in 'iuf':
+        raise ValueError("Timestamps must be numeric or datetime64.")
+    return timestamps, interval, origin, False
+
+class Resampler:
+    """
+    Reduce irregular (timestamp, values) points, fed chunk by chunk, to a
+    regular grid of buckets of width `interval` starting at `origin`.
+
+    Each chunk is sorted by bucket and reduced with np.add.reduceat and
+    np.maximum.reduceat for all columns at once, then folded into per-bucket
+    sums, counts and last values, so memory depends on the number of buckets
+    and not on the number of points. Chunks need not be in time order; NaN
+    values are ignored. Datetime timestamps take a pandas-style interval
+    (e.g. "15min").
+
+    Without an explicit `origin`, datetime grids start at midnight of the
+    first timestamp's day, like pandas' origin='start_day' (the day of the
+    first chunk, so chunks fed out of time order should pass `origin`).
+    Numeric grids are aligned to multiples of `interval`.
+
+    As in pandas, 'last' is the value with the latest timestamp, and equal
+    timestamps are settled by row order. Rows are numbered globally in the
+    order the chunks arrive; a chunk fed out of row order (e.g. from a
+    worker) passes the global index of its first row as `first_row`.
+    """
+
+    def __init__(self, interval, origin=None):
+        self.interval = interval
+        self.origin = origin
+        self.is_datetime = None
+        self._first = 0
+        self._rows = 0
+        self._sums = self._counts = self._last_time = self._last_row = self._last_value = None
+
+    def _empty(self, rows: int, time_dtype) -> dict:
+        lowest = np.iinfo(np.int64).min if time_dtype.kind in 'iu' else -np.inf
+        return {
+            '_sums': np.zeros((rows, self._m)),
+            '_counts': np.zeros((rows, self._m), dtype=np.int64),
+            '_last_time': np.full((rows, self._m), lowest, dtype=time_dtype),
+            '_last_row': np.full((rows, self._m), -1, dtype=np.int64),
+            '_last_value': np.full((rows, self._m), np.nan)
+        }
+
+    def _reserve(self, low: int, high: int, time_dtype):
+        """Grow the bucket arrays so they cover buckets [low, high)."""
+        if self._sums is None:
+            self._first = low
+            for name, array in self._empty(high - low, time_dtype).items():
+                setattr(self, name, array)
+            return
+        first, end = self._first, self._first + len(self._sums)
+        if low >= first and high <= end:
+            return
+        # Dobra a capacidade ao crescer para o fim, como numa lista
+        new_first = min(low, first)
+        new_end = max(high, end + len(self._sums)) if high > end else end
+        offset = first - new_first
+        for name, grown in self._empty(new_end - new_first, self._last_time.dtype).items():
+            old = getattr(self, name)
+            grown[offset:offset + len(old)] = old
+            setattr(self, name, grown)
+        self._first = new_first
+        self._size += offset
+
+    def update(self, timestamps, values, first_row: Optional[int] = None) -> 'Resampler':
+        values = np.asarray(values, dtype=np.float64)
+        values = values.reshape(values.shape[0], -1)
+        ticks, interval, origin, is_datetime = _as_ticks(timestamps, self.interval, self.origin)
+        if len(ticks) != len(values):
+            raise ValueError("Timestamps and values must have the same length.")
+        if not len(ticks):
+            return self
+        first_row = self._rows if first_row is None else first_row
+        self._rows = max(self._rows, first_row + len(ticks))
+        if self.is_datetime is None:
+            self.is_datetime = is_datetime
+            self._m = values.shape[1]
+            self._size = 0
+            if origin is None:
+                # Como origin='start_day' do pandas: meia-noite do primeiro dia; números alinham a múltiplos do intervalo
+                step = DAY_NANOSECONDS if is_datetime else interval
+                origin = (ticks.min() // step) * step
+            self._origin = origin
+            self._interval = interval
+        elif is_datetime != self.is_datetime or values.shape[1] != self._m:
+            raise ValueError("All chunks must have the same timestamp type and number of columns.")
+
+        buckets = ((ticks - self._origin) // self._interval).astype(np.int64)
+        # Ordenação estável: timestamps iguais ficam na ordem das linhas
+        order = np.lexsort((ticks, buckets))
+        buckets, ticks, values = buckets[order], ticks[order], values[order]
+        row_numbers = first_row + order
+        starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+        self._reserve(int(buckets[0]), int(buckets[-1]) + 1, ticks.dtype)
+        self._size = max(self._size, int(buckets[-1]) + 1 - self._first)
+        rows = buckets[starts] - self._first
+
+        valid = ~np.isnan(values)
+        self._sums[rows] += np.add.reduceat(np.where(valid, values, 0.0), starts, axis=0)
+        self._counts[rows] += np.add.reduceat(valid, starts, axis=0)
+
+        # Último valor válido de cada balde: maior posição válida dentro do bloco ordenado
+        last = np.maximum.reduceat(np.where(valid, np.arange(len(values))[:, None], -1), starts, axis=0)
+        found = last >= 0
+        columns = np.broadcast_to(np.arange(self._m), last.shape)
+        last_time = np.where(found, ticks[np.maximum(last, 0)], self._last_time[rows])
+        last_row = row_numbers[np.maximum(last, 0)]
+        # Entre blocos, empates no timestamp vão para a linha de maior índice global
+        newer = found & ((last_time > self._last_time[rows]) |
+                         ((last_time == self._last_time[rows]) & (last_row > self._last_row[rows])))
+        target_rows = np.broadcast_to(rows[:, None], last.shape)[newer]
+        self._last_time[target_rows, columns[newer]] = last_time[newer]
+        self._last_row[target_rows, columns[newer]] = last_row[newer]
+        self._last_value[target_rows, columns[newer]] = values[last[newer], columns[newer]]
+        return self
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Left edge of every bucket of the grid."""
+        if self._sums is None:
+            return np.empty(0)
+        ticks = self._origin + (self._first + np.arange(self._size)) * self._interval
+        return ticks.astype('datetime64[ns]') if self.is_datetime else ticks
+
+    def result(self, aggregation: str = 'mean', fill: Optional[str] = None) -> np.ndarray:
+        """
+        Aggregated values on the grid (buckets x columns). Empty buckets are
+        NaN for mean and last (0 for sum and count) unless `fill` is 'ffill'
+        or 'interpolate' (linear, per column).
+        """
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(f"Aggregation must be one of {AGGREGATIONS}.")
+        if fill not in FILL_METHODS:
+            raise ValueError(f"Fill must be one of {FILL_METHODS}.")
+        if self._sums is None:
+            raise ValueError("No data has been added.")
+        sums, counts = self._sums[:self._size], self._counts[:self._size]
+        if aggregation == 'sum':
+            return sums.copy()
+        if aggregation == 'count':
+            return counts.copy()
+        if aggregation == 'last':
+            result = self._last_value[:self._size].copy()
+        else:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result = np.where(counts > 0, sums / counts, np.nan)
+        return fill_gaps(result, fill)
+
+def fill_gaps(values: np.ndarray, fill: Optional[str]) -> np.ndarray:
+    """Fill NaN buckets forward (leading ones backward) or by linear interpolation, column by column."""
+    if fill is None or not np.isnan(values).any():
+        return values
+    if fill == 'ffill':
+        return pd.DataFrame(values).ffill().bfill().to_numpy()
+    positions = np.arange(len(values))
+    filled = values.copy()
+    for column in range(values.shape[1]):
+        known = ~np.isnan(values[:, column])
+        if known.any():
+            filled[:, column] = np.interp(positions, positions[known], values[known, column])
+    return filled
+
+def resample_chunks(chunks: Iterable[tuple], interval, aggregation: str = 'mean', origin=None, fill: Optional[str] = None):
+    """Resample an iterable of (timestamps, values) chunks; returns the grid timestamps and values."""
+    resampler = Resampler(interval, origin)
+    for timestamps, values in chunks:
+        resampler.update(timestamps, values)
+    return resampler.timestamps, resampler.result(aggregation, fill)
+
+def array_chunks(timestamps, values, chunk_rows: int = CHUNK_ROWS) -> Iterator[tuple]:
+    """
+    Matching row chunks of two arrays, e.g. (timestamps, values) or (X, Y), that may be
+    memory-mapped (np.load(..., mmap_mode='r') or np.memmap): only one chunk at a time is read from disk.
+    """
+    for start in range(0, len(timestamps), chunk_rows):
+        yield np.asarray(timestamps[start:start + chunk_rows]), np.asarray(values[start:start + chunk_rows])
+
+def frame_chunks(frames: Iterable[pd.DataFrame], time_field: str, value_fields: list[str]) -> Iterator[tuple]:
+    """
+    (timestamps, values) chunks from an iterator of DataFrames, such as
+    pd.read_csv(..., chunksize=n) or read_csv_streaming(..., chunksize=n).
+    Non-numeric time columns are parsed as datetimes.
+    """
+    for frame in frames:
+        timestamps = frame[time_field]
+        if not pd.api.types.is_numeric_dtype(timestamps) and not pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps)
+        yield timestamps.to_numpy(), frame[value_fields].to_numpy(dtype=np.float64)
@@ -0,0 +1,99 @@
+import warnings
+from typing import Optional
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+STATISTICS = ('sum', 'mean', 'std', 'min', 'max', 'median')
+
+def window_bounds(window: int, center: bool) -> tuple[int, int]:
+    """Number of samples before and after each point covered by the window."""
+    if center:
+        # Mesma convenção de np.convolve(mode='same')
+        return window // 2, (window - 1) // 2
+    return window - 1, 0
+
+def _as_2d(data) -> tuple[np.ndarray, bool]:
+    data = np.asarray(data, dtype=np.float64)
+    if data.ndim == 1:
+        return data[:, None], True
+    if data.ndim != 2:
+        raise ValueError("Data should be either 1D or 2D.")
+    return data, False
+
+def _window_sums(values: np.ndarray, left: int, right: int) -> np.ndarray:
+    """Sum of every window along axis 0 from a cumulative sum: O(n) regardless of the window."""
+    n = values.shape[0]
+    cumulative = np.zeros((n + 1,) + values.shape[1:])
+    np.cumsum(values, axis=0, out=cumulative[1:])
+    positions = np.arange(n)
+    upper = np.minimum(positions + right + 1, n)
+    lower = np.maximum(positions - left, 0)
+    return cumulative[upper] - cumulative[lower]
+
+def _window_extreme(values: np.ndarray, left: int, right: int, ufunc, fill: float) -> np.ndarray:
+    """
+    Sliding minimum or maximum in O(n) with the van Herk/Gil-Werman algorithm:
+    prefix and suffix accumulations inside blocks of one window each.
+    """
+    n, m = values.shape
+    window = left + right + 1
+    blocks = -(-(n + window - 1) // window)
+    padded = np.full((blocks * window, m), fill)
+    padded[left:left + n] = values
+    padded = padded.reshape(blocks, window, m)
+    prefix = ufunc.accumulate(padded, axis=1).reshape(-1, m)
+    suffix = ufunc.accumulate(padded[:, ::-1], axis=1)[:, ::-1].reshape(-1, m)
+    return ufunc(suffix[:n], prefix[window - 1:window - 1 + n])
+
+def rolling(data, window: int, statistic: str = 'mean', center: bool = True, min_periods: Optional[int] = None, ddof: int = 1) -> np.ndarray:
+    """
+    Rolling-window statistic along the time axis of a 1-D series or of every column of a 2-D array.
+
+    Sum, mean and std come from cumulative sums and min/max from block-wise
+    accumulations, so they run in O(n) for any window, for all columns at
+    once. The median uses a strided window view, O(n * window). NaN values
+    are skipped; positions whose window has fewer than `min_periods` valid
+    values (default: the whole window) are NaN. With `center`, the window is
+    centered on each point; otherwise it ends at the point (trailing).
+    """
+    if statistic not in STATISTICS:
+        raise ValueError(f"Statistic must be one of {STATISTICS}.")
+    if window < 1:
+        raise ValueError("Window size must be at least 1.")
+    min_periods = window if min_periods is None else min_periods
+    values, is_1d = _as_2d(data)
+    left, right = window_bounds(window, center)
+
+    valid = ~np.isnan(values)
+    counts = _window_sums(valid.astype(np.float64), left, right)
+    filled = np.where(valid, values, 0.0)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if statistic in ('sum', 'mean', 'std'):
+            sums = _window_sums(filled, left, right)
+            if statistic == 'sum':
+                result = sums
+            elif statistic == 'mean':
+                result = sums / counts
+            else:
+                # Centraliza cada coluna para reduzir o cancelamento numérico
+                # Colunas só com NaN ficam com deslocamento 0, sem o aviso "Mean of empty slice" do nanmean
+                offset = filled.sum(axis=0) / np.maximum(valid.sum(axis=0), 1)
+                shifted = np.where(valid, values - offset, 0.0)
+                sums = _window_sums(shifted, left, right)
+                squares = _window_sums(shifted ** 2, left, right)
+                result = np.sqrt(np.maximum(squares - sums ** 2 / counts, 0.0) / (counts - ddof))
+                result[counts <= ddof] = np.nan
+        elif statistic == 'min':
+            result = _window_extreme(np.where(valid, values, np.inf), left, right, np.minimum, np.inf)
+        elif statistic == 'max':
+            result = _window_extreme(np.where(valid, values, -np.inf), left, right, np.maximum, -np.inf)
+        else:
+            padded = np.full((values.shape[0] + window - 1, values.shape[1]), np.nan)
+            padded[left:left + values.shape[0]] = values
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                result = np.nanmedian(sliding_window_view(padded, window, axis=0), axis=-1)
+
+    result = np.where(counts >= max(min_periods, 1), result, np.nan)
+    return result[:, 0] if is_1d else result
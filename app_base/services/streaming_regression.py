@@ -0,0 +1,147 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator
+import numpy as np
+import pandas as pd
+from scipy import linalg
+from .linear_solvers import RANK_TOLERANCE, LeastSquaresSolution
+
+class RegressionStatistics:
+    """
+    Sufficient statistics of a linear regression with intercept, accumulated
+    chunk by chunk: the count, the means of X and Y and the centered cross
+    products Sxx, Sxy and Syy.
+
+    Chunks are merged with the pairwise update of Chan et al. (the matrix
+    form of RunningMoments), which keeps the cross products centered and
+    numerically stable, and two accumulators (e.g. from parallel workers)
+    merge the same way. Memory is O((p + k)^2) whatever the number of rows,
+    and the solution equals the batch least-squares fit.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = self.mean_y = None
+        self.sxx = self.sxy = self.syy = None
+
+    def update(self, X, Y) -> 'RegressionStatistics':
+        X = np.asarray(X, dtype=np.float64)
+        Y = np.asarray(Y, dtype=np.float64)
+        X = X[:, None] if X.ndim == 1 else X
+        Y = Y[:, None] if Y.ndim == 1 else Y
+        if X.shape[0] != Y.shape[0]:
+            raise ValueError(f"X and Y must have the same number of rows, got {X.shape[0]} and {Y.shape[0]}.")
+        if not (np.all(np.isfinite(X)) and np.all(np.isfinite(Y))):
+            raise ValueError("X and Y must not contain NaN or infinite values.")
+        if not len(X):
+            return self
+        chunk = RegressionStatistics()
+        chunk.n = len(X)
+        chunk.mean_x, chunk.mean_y = X.mean(axis=0), Y.mean(axis=0)
+        centered_x, centered_y = X - chunk.mean_x, Y - chunk.mean_y
+        chunk.sxx = centered_x.T @ centered_x
+        chunk.sxy = centered_x.T @ centered_y
+        chunk.syy = centered_y.T @ centered_y
+        return self.merge(chunk)
+
+    def merge(self, other: 'RegressionStatistics') -> 'RegressionStatistics':
+        if not other.n:
+            return self
+        if not self.n:
+            self.n, self.mean_x, self.mean_y = other.n, other.mean_x, other.mean_y
+            self.sxx, self.sxy, self.syy = other.sxx, other.sxy, other.syy
+            return self
+        if other.sxx.shape != self.sxx.shape or other.syy.shape != self.syy.shape:
+            raise ValueError("Statistics must come from the same number of X and Y columns.")
+        total = self.n + other.n
+        weight = self.n * other.n / total
+        delta_x, delta_y = other.mean_x - self.mean_x, other.mean_y - self.mean_y
+        self.sxx = self.sxx + other.sxx + weight * np.outer(delta_x, delta_x)
+        self.sxy = self.sxy + other.sxy + weight * np.outer(delta_x, delta_y)
+        self.syy = self.syy + other.syy + weight * np.outer(delta_y, delta_y)
+        self.mean_x = self.mean_x + delta_x * other.n / total
+        self.mean_y = self.mean_y + delta_y * other.n / total
+        self.n = total
+        return self
+
+    @property
+    def xtx(self) -> np.ndarray:
+        """X^T X of the design with a leading column of ones."""
+        top = np.concatenate(([self.n], self.n * self.mean_x))
+        rest = np.hstack((self.n * self.mean_x[:, None], self.sxx + self.n * np.outer(self.mean_x, self.mean_x)))
+        return np.vstack((top, rest))
+
+    @property
+    def xty(self) -> np.ndarray:
+        """X^T Y of the design with a leading column of ones."""
+        return np.vstack((self.n * self.mean_y, self.sxy + self.n * np.outer(self.mean_x, self.mean_y)))
+
+    @property
+    def yty(self) -> np.ndarray:
+        return self.syy + self.n * np.outer(self.mean_y, self.mean_y)
+
+    def solve(self) -> LeastSquaresSolution:
+        """
+        Intercept and coefficients (first row is the intercept) from the
+        centered normal equations Sxx B = Sxy: Cholesky when Sxx is positive
+        definite, otherwise the minimum-norm solution from its eigenvectors.
+        """
+        if not self.n:
+            raise ValueError("No data has been added.")
+        p = self.sxx.shape[0]
+        try:
+            factor = linalg.cho_factor(self.sxx, check_finite=False)
+            sxx_inv = linalg.cho_solve(factor, np.eye(p), check_finite=False)
+            method, rank = 'cholesky', p
+        except linalg.LinAlgError:
+            eigenvalues, eigenvectors = linalg.eigh(self.sxx, check_finite=False)
+            kept = eigenvalues > RANK_TOLERANCE * max(eigenvalues.max(), 0.0)
+            sxx_inv = (eigenvectors[:, kept] / eigenvalues[kept]) @ eigenvectors[:, kept].T
+            method, rank = 'eigh', int(kept.sum())
+        slopes = sxx_inv @ self.sxy
+        intercept = self.mean_y - self.mean_x @ slopes
+
+        # Inversa em blocos de X^T X com a coluna de uns, sem montar a matriz não centrada
+        shifted = sxx_inv @ self.mean_x
+        xtx_inv = np.empty((p + 1, p + 1))
+        xtx_inv[0, 0] = 1 / self.n + self.mean_x @ shifted
+        xtx_inv[0, 1:] = xtx_inv[1:, 0] = -shifted
+        xtx_inv[1:, 1:] = sxx_inv
+        return LeastSquaresSolution(np.vstack((intercept, slopes)), method, rank + 1, self.n, xtx_inv=xtx_inv)
+
+    def residual_sum_of_squares(self, coefficients: np.ndarray) -> np.ndarray:
+        """RSS of each response for slopes fitted with the intercept (without the intercept row)."""
+        return np.diag(self.syy) - np.einsum('pk,pk->k', coefficients, self.sxy)
+
+def _chunk_statistics(chunk) -> RegressionStatistics:
+    return RegressionStatistics().update(*chunk)
+
+def accumulate_statistics(chunks: Iterable[tuple], workers: int = 1) -> RegressionStatistics:
+    """
+    Regression statistics of an iterable of (X, Y) row chunks. With more than
+    one worker, chunks are reduced in parallel threads (the matrix products
+    release the GIL), a bounded number at a time, and merged in order.
+    """
+    statistics = RegressionStatistics()
+    if workers <= 1:
+        for X, Y in chunks:
+            statistics.update(X, Y)
+        return statistics
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Poucos blocos em voo de cada vez, para a memória continuar limitada
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_chunk_statistics, chunk))
+            if len(pending) >= 2 * workers:
+                statistics.merge(pending.popleft().result())
+        while pending:
+            statistics.merge(pending.popleft().result())
+    return statistics
+
+def frame_regression_chunks(frames: Iterable[pd.DataFrame], columns_x: list[str], columns_y: list[str]) -> Iterator[tuple]:
+    """
+    (X, Y) chunks from an iterator of DataFrames, such as pd.read_csv(..., chunksize=n)
+    or read_csv_streaming(..., chunksize=n).
+    """
+    for frame in frames:
+        yield frame[columns_x].to_numpy(dtype=np.float64), frame[columns_y].to_numpy(dtype=np.float64)
@@ -0,0 +1,164 @@
+from typing import Optional
+import numpy as np
+from .column_stats import RunningMoments
+from .decomposition import moving_average_trend
+from .describe import QuantileSketch
+from .rolling import rolling, window_bounds
+from .time_series import TimeSeries
+
+class StreamingTimeSeries:
+    """
+    Append-only time series for live feeds, kept in a fixed-capacity ring buffer.
+
+    Each call to `append` updates, in O(window + period) per new point, the
+    trailing trend, running descriptive statistics (merged Welford moments
+    and a quantile sketch over the whole history) and the state of the additive seasonal
+    decomposition: the centered moving-average trend of points whose window
+    just completed and per-phase sums of the detrended values. The seasonal
+    profile therefore matches a batch decomposition of the full history
+    without recomputing it. Only the last `capacity` points are kept.
+    """
+
+    def __init__(self, n_series: int = 1, capacity: int = 10_000, window: int = 5, frequency: Optional[int] = None):
+        if frequency is not None and frequency < 1:
+            raise ValueError("Frequency must be a positive integer.")
+        self.n_series = n_series
+        self.window = window
+        self.frequency = frequency
+        # Linhas anteriores necessárias para atualizar a média móvel e a tendência centrada
+        self._context = max(window - 1, frequency or 0)
+        if capacity <= self._context:
+            raise ValueError(f"Capacity must be greater than {self._context} for this window and frequency.")
+        self.capacity = capacity
+        self.count = 0
+
+        self._values = np.full((capacity, n_series), np.nan)
+        self._trend = np.full((capacity, n_series), np.nan)
+        self._centered_trend = np.full((capacity, n_series), np.nan)
+        self._timestamps = None
+        self.moments = RunningMoments()
+        self.quantiles = QuantileSketch()
+        if frequency:
+            self._phase_sums = np.zeros((frequency, n_series))
+            self._phase_counts = np.zeros((frequency, n_series))
+
+    def _positions(self, start: int, stop: int) -> np.ndarray:
+        return np.arange(start, stop) % self.capacity
+
+    def _recent(self, ring: np.ndarray, rows: int) -> np.ndarray:
+        """Last `rows` entries of a ring buffer, oldest first."""
+        return ring[self._positions(self.count - rows, self.count)]
+
+    def _as_rows(self, values) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 0:
+            values = values.reshape(1, 1)
+        elif values.ndim == 1:
+            # Uma série: cada valor é um ponto; várias séries: o vetor é um único ponto
+            values = values.reshape(-1, 1) if self.n_series == 1 else values.reshape(1, -1)
+        if values.ndim != 2 or values.shape[1] != self.n_series:
+            raise ValueError(f"Values must have {self.n_series} column(s).")
+        return values
+
+    def append(self, timestamps, values):
+        """Append new points (timestamps and one value per series) to the end of the series."""
+        values = self._as_rows(values)
+        timestamps = np.atleast_1d(np.asarray(timestamps))
+        if len(timestamps) != len(values):
+            raise ValueError("Timestamps and values must have the same length.")
+        if not len(values):
+            return self
+        if self._timestamps is None:
+            self._timestamps = np.empty(self.capacity, dtype=timestamps.dtype)
+
+        start = self.count
+        history = self._recent(self._values, min(start, self._context))
+        window_data = np.vstack((history, values))
+        offset = start - len(history)
+
+        # Tendência móvel (janela terminando em cada ponto) só dos pontos novos
+        trend = rolling(window_data, self.window, 'mean', center=False, min_periods=1)[len(history):]
+        self.moments.update(values)
+        self.quantiles.update(values)
+
+        # Pontos novos mais antigos que a capacidade nunca chegam ao buffer
+        kept = slice(max(0, len(values) - self.capacity), None)
+        positions = self._positions(start, start + len(values))[kept]
+        self._values[positions] = values[kept]
+        self._trend[positions] = trend[kept]
+        self._centered_trend[positions] = np.nan
+        self._timestamps[positions] = timestamps[kept]
+        self.count += len(values)
+
+        if self.frequency:
+            self._update_decomposition(window_data, offset, start)
+        return self
+
+    def _update_decomposition(self, window_data: np.ndarray, offset: int, start: int):
+        """Fold in the points whose centered moving-average window completed with this append."""
+        period = self.frequency
+        left, right = window_bounds(period + 1 if period % 2 == 0 else period, center=True)
+        first = max(left, start - right - offset)
+        last = len(window_data) - right
+        if first >= last:
+            return
+        centered = moving_average_trend(window_data, period)[first:last]
+        detrended = window_data[first:last] - centered
+        phases = (offset + np.arange(first, last)) % period
+        valid = ~np.isnan(detrended)
+        np.add.at(self._phase_sums, phases, np.where(valid, detrended, 0.0))
+        np.add.at(self._phase_counts, phases, valid)
+
+        in_buffer = offset + np.arange(first, last) >= self.count - self.capacity
+        self._centered_trend[self._positions(offset + first, offset + last)[in_buffer]] = centered[in_buffer]
+
+    @property
+    def size(self) -> int:
+        """Number of points currently held in the buffer."""
+        return min(self.count, self.capacity)
+
+    @property
+    def data(self) -> np.ndarray:
+        return self._recent(self._values, self.size)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        if self._timestamps is None:
+            return np.empty(0)
+        return self._recent(self._timestamps, self.size)
+
+    @property
+    def trend(self) -> np.ndarray:
+        """Trailing moving average of the buffered points."""
+        return self._recent(self._trend, self.size)
+
+    def describe(self):
+        """Descriptive statistics of every point appended so far, per series (approximate median from a KLL sketch)."""
+        return {
+            'mean': self.moments.mean,
+            'median': self.quantiles.quantile(0.5),
+            'std_dev': self.moments.std_dev,
+            'min': self.moments.minimum,
+            'max': self.moments.maximum,
+            'count': self.count
+        }
+
+    def seasonal_profile(self) -> np.ndarray:
+        """Seasonal component of each phase of the cycle (frequency x series)."""
+        if not self.frequency:
+            raise ValueError("Frequency must be set for seasonal decomposition.")
+        with np.errstate(invalid='ignore', divide='ignore'):
+            averages = self._phase_sums / self._phase_counts
+        return averages - averages.mean(axis=0)
+
+    def seasonal_decompose(self):
+        """Trend, seasonal and residual components of the buffered points, from the incremental state."""
+        profile = self.seasonal_profile()
+        trend = self._recent(self._centered_trend, self.size)
+        seasonal = profile[np.arange(self.count - self.size, self.count) % self.frequency]
+        return trend, seasonal, self.data - trend - seasonal
+
+    def to_timeseries(self) -> TimeSeries:
+        """Snapshot of the buffered points as a regular TimeSeries."""
+        data = self.data[:, 0] if self.n_series == 1 else self.data
+        return TimeSeries(data, self.timestamps, self.frequency)
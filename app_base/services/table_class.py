@@ -1,66 +1,103 @@
-from pydantic import BaseModel, computed_field, field_validator
+from pydantic import BaseModel, ConfigDict, PrivateAttr, computed_field, field_serializer, field_validator, model_validator
 from typing import Optional
-from enum import Enum
 import os
 from functools import cached_property
+import numpy as np
 import pandas as pd
-import math
-
-class ColumnType(str, Enum):
-    Int = "int"
-    Float = "float"
-    String = "string"
-    Empty = "empty"
+from .type_inference import ColumnType, InferredColumn, infer_column_type
+from .column_stats import ColumnProfile, ColumnStats, profile_column
 
 class Column(BaseModel):
+    """A named column backed by a NumPy array; pydantic only validates the metadata."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     name: str = ""
-    values: list[str]|list[int]|list[float]|list[None] = []
+    values: np.ndarray = np.empty(0)
+    _value_type: ColumnType = PrivateAttr(ColumnType.Empty)
+    _null_mask: np.ndarray = PrivateAttr(None)
+    _profile: Optional[ColumnProfile] = PrivateAttr(None)
 
-    @field_validator('values') 
+    @field_validator('values', mode='before')
     @classmethod
     def getvalues(cls, values, other_info):
-        if not values:
+        if isinstance(values, pd.Series):
+            values = values.to_numpy()
+        elif not isinstance(values, np.ndarray):
+            values = np.asarray(values, dtype=object)
+        if values.ndim != 1:
+            raise ValueError('values must be one-dimensional')
+        if not values.size:
             raise ValueError('values cannot be empty')
-        if type(values[0]) == str:
-            if all([str(val).isdigit() for val in values]):
-                values = [int(val) for val in values]
-            elif all([val.replace(".", "", 1).isdigit() for val in values]):
-                values = [float(val) for val in values]
-        elif all([type(val) == float and math.isnan(val) for val in values]):
-            values = [None for val in values]
         return values
 
+    @model_validator(mode='after')
+    def infer_type(self):
+        self._infer()
+        return self
+
+    def __setattr__(self, name, value):
+        if name == 'values':
+            value = self.getvalues(value, None)
+        super().__setattr__(name, value)
+        if name == 'values':
+            self._infer()
+
+    def _infer(self):
+        inferred = infer_column_type(self.values)
+        super().__setattr__('values', inferred.values)
+        self._value_type = inferred.value_type
+        self._null_mask = inferred.null_mask
+        # Novos valores invalidam o perfil já calculado
+        self._profile = None
+
+    @classmethod
+    def from_inferred(cls, name: str, inferred: InferredColumn, profile: Optional[ColumnProfile] = None) -> 'Column':
+        """Build a column from an inference (and profile) already computed elsewhere, e.g. in a worker."""
+        column = cls.model_construct(name=name, values=inferred.values)
+        column._value_type = inferred.value_type
+        column._null_mask = inferred.null_mask
+        column._profile = profile
+        return column
+
+    @field_serializer('values')
+    def serialize_values(self, values):
+        return values.tolist()
+
+    @property
+    def null_mask(self) -> np.ndarray:
+        return self._null_mask
+
     @computed_field
     def value_type(self) -> ColumnType:
-        if all(not val for val in self.values):
-            return ColumnType.Empty
-        if type(self.values[0]) == type(None):
-            return ColumnType.Empty
-        if type(self.values[0]) == int:
-            return ColumnType.Int
-        if type(self.values[0]) == float:
-            return ColumnType.Float
-        return ColumnType.String  
-    
+        return self._value_type
+
+    @property
+    def profile(self) -> ColumnProfile:
+        """
+        Type and statistics of the column, computed on first access.
+
+        Profiles are memoized by a fingerprint of the values, so a column
+        rebuilt from the same data (e.g. on a Streamlit rerun) reuses them.
+        """
+        if self._profile is None:
+            self._profile = profile_column(self.values, self.null_mask, self.value_type)
+        return self._profile
+
+    @property
+    def stats(self) -> ColumnStats:
+        return self.profile.stats
+
     @computed_field
-    def moda(self) -> str|int|float:
-        return max(set(self.values), key = self.values.count)
-    
+    def moda(self) -> Optional[str|int|float]:
+        return self.stats.mode
+
     @computed_field
     def media(self) -> Optional[float]:
-        if self.value_type == ColumnType.String or self.value_type == ColumnType.Empty:
-            return None
-        return sum([float(val) for val in self.values]) / len(self.values)
-    
+        return self.stats.mean
+
     @computed_field
     def mediana(self) -> Optional[float]:
-        if self.value_type == ColumnType.String or self.value_type == ColumnType.Empty:
-            return None
-        sorted_values = sorted(self.values)
-        mid = len(sorted_values) // 2
-        if len(sorted_values) % 2 == 0:
-            return (sorted_values[mid] + sorted_values[mid-1]) / 2
-        return sorted_values[mid]
+        return self.stats.median
 
 
 class Table(BaseModel):
@@ -96,11 +133,50 @@ class Table(BaseModel):
     def column_dict(self) -> dict[str, Column]:
         return {column.name: column for column in self.columns}
     
+    def to_array(self, fields: list[str]) -> np.ndarray:
+        """
+        Numeric columns as one C-contiguous float64 block (n_samples, len(fields)).
+
+        Types are validated on the column metadata (inferred type and dtype),
+        never per element, and each column is copied once straight into its
+        slot of the block. A single float64 column is returned as a read-only
+        view of its buffer, without copying.
+        """
+        missing = [field for field in fields if field not in self.column_dict]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in table.")
+        columns = [self.column_dict[field] for field in fields]
+        not_numeric = [column.name for column in columns
+                       if column.value_type not in (ColumnType.Int, ColumnType.Float) or column.values.dtype.kind not in 'iuf']
+        if not_numeric:
+            raise ValueError(f"Columns {not_numeric} are not numeric.")
+        if len({len(column.values) for column in columns}) > 1:
+            raise ValueError("Columns must have the same number of rows.")
+
+        if len(columns) == 1 and columns[0].values.dtype == np.float64 and columns[0].values.flags.c_contiguous:
+            block = columns[0].values[:, None]
+            block.setflags(write=False)
+            return block
+        block = np.empty((len(columns[0].values) if columns else 0, len(columns)), dtype=np.float64)
+        for position, column in enumerate(columns):
+            block[:, position] = column.values
+        return block
+
+    def profiles(self) -> dict[str, ColumnProfile]:
+        """Profiles of every column, serializable with pydantic."""
+        return {column.name: column.profile for column in self.columns}
+
     @classmethod
-    def from_dataframe(cls, df: pd.DataFrame) -> 'Table':
-        columns = []
-        for column_name in df.columns:
+    def from_dataframe(cls, df: pd.DataFrame, workers: int = 1, executor: str = "process") -> 'Table':
+        """
+        Build a Table whose columns reference the DataFrame arrays without copying the cells.
 
-            column = Column(name=column_name, values=[val if not (type(val) == float and math.isnan(val)) else "" for val in df[column_name]])
-            columns.append(column)
-        return cls(columns=columns)
\ No newline at end of file
+        With more than one worker, wide inputs are inferred and profiled in
+        parallel (see services.parallel_profiling).
+        """
+        if workers == 1:
+            columns = [Column(name=column_name, values=df[column_name].to_numpy()) for column_name in df.columns]
+        else:
+            from .parallel_profiling import profile_dataframe
+            columns = profile_dataframe(df, workers=workers, executor=executor)
+        return cls(columns=columns)
@@ -1,158 +1,194 @@
 import numpy as np
 import pandas as pd
-from statsmodels.tsa.seasonal import seasonal_decompose
 from .table_class import ColumnType, Table
+from .rolling import rolling
+from .decomposition import decompose
+from .describe import describe
+from .downsampling import MinMaxPyramid
+from .periodicity import autocorrelation, estimate_period, periodogram
+from .forecasting import AutoRegressive, HoltWinters
+from .resampling import array_chunks, resample_chunks
+from scipy.signal import find_peaks
 import matplotlib.pyplot as plt
+
+# Acima disso o gráfico desenha uma versão reduzida da série
+MAX_PLOT_POINTS = 2000
+FORECAST_METHODS = ('mean', 'holt_winters', 'ar')
+
 class TimeSeries:
     def __init__(self, data, timestamps, frequency=None):
-        self.data = np.array(data)  # Garantir que os dados sejam convertidos para NumPy array
-        self.timestamps = pd.to_datetime(timestamps)  # Garantir que os timestamps sejam convertidos para datetime
+        self.data = np.asarray(data)  # Garantir que os dados sejam um array NumPy
+        self.timestamps = np.asarray(timestamps)
         self.frequency = frequency
 
         # Verificar dimensões dos dados
         if self.data.ndim not in [1, 2]:
             raise ValueError("Data should be either 1D or 2D.")
 
-        # Calcular atributos de erro durante a inicialização
-        self.error = self.calculate_error()
-        self.squared_error = self.calculate_squared_error()
-        self.error_std_dev = self.calculate_error_std_dev()
+        # Resultados derivados de self.data, calculados sob demanda
+        self._cache = {}
 
-    def forecast(self, steps):
-        """Forecast future values based on the time series data using simple mean."""
-        forecast_value = np.mean(self.data)
-        return [forecast_value] * steps
+    def _cached(self, key, compute):
+        """Return the cached result for `key`, computing it on first use."""
+        if key not in self._cache:
+            result = compute()
+            if isinstance(result, np.ndarray):
+                # Evita que quem recebe o array altere o cache sem querer
+                result.setflags(write=False)
+            self._cache[key] = result
+        return self._cache[key]
+
+    def forecast(self, steps, method='mean', **options):
+        """
+        Forecast future values based on the time series data: the simple mean
+        (default), Holt-Winters exponential smoothing or an AR model (see
+        services.forecasting), one column per series for 2-D data.
+        """
+        if method == 'mean':
+            forecast_value = np.mean(self.data)
+            return [forecast_value] * steps
+        predictions = self.fit_forecaster(method, **options).forecast(steps)
+        return predictions[:, 0] if self.data.ndim == 1 else predictions
+
+    def fit_forecaster(self, method='holt_winters', **options):
+        """
+        Forecasting model fitted to every column, cached per method and options
+        so forecasts with different horizons do not refit it.
+        """
+        if method not in FORECAST_METHODS[1:]:
+            raise ValueError(f"Method must be one of {FORECAST_METHODS}.")
+
+        def fit():
+            if method == 'holt_winters':
+                # Usa a frequência da série como período sazonal, se nenhum for dado
+                return HoltWinters(**{'period': self.frequency, **options}).fit(self.data)
+            return AutoRegressive(**options).fit(self.data)
+        # Listas e arrays (grades de parâmetros) viram tuplas para servir de chave do cache
+        key = tuple(sorted((name, tuple(np.atleast_1d(value).tolist()) if isinstance(value, (list, tuple, np.ndarray))
+                            else value) for name, value in options.items()))
+        return self._cached(('forecaster', method, self.frequency, key), fit)
 
     def normalize(self):
         """Normalize the time series data to a range of 0 to 1."""
         min_val = np.min(self.data)
         max_val = np.max(self.data)
         self.data = (self.data - min_val) / (max_val - min_val)
+        self._cache.clear()
 
     def cycle_analysis(self):
-        """Identify cycles in the time series data."""
-        from scipy.signal import find_peaks
-        peaks, _ = find_peaks(self.data)
-        troughs, _ = find_peaks(-self.data)
-        return peaks, troughs
+        """
+        Identify cycles in the time series data: positions of peaks and troughs,
+        or one array of each per column for 2-D data.
+        """
+        def find_cycles():
+            if self.data.ndim == 1:
+                return find_peaks(self.data)[0], find_peaks(-self.data)[0]
+            columns = self.data.T
+            return [find_peaks(column)[0] for column in columns], [find_peaks(-column)[0] for column in columns]
+        return self._cached('cycles', find_cycles)
+
+    def spectrum(self):
+        """Frequencies (cycles per sample) and periodogram of every column, computed once with the FFT."""
+        return self._cached('spectrum', lambda: periodogram(self.data))
+
+    def autocorrelation(self):
+        """Autocorrelation of every column at every lag, computed once through the FFT."""
+        return self._cached('autocorrelation', lambda: autocorrelation(self.data))
+
+    def estimate_period(self, min_period=2, max_period=None):
+        """Dominant period of each column and its autocorrelation (see services.periodicity)."""
+        return self._cached(('period', min_period, max_period),
+                            lambda: estimate_period(*self.spectrum(), self.autocorrelation(), min_period, max_period))
+
+    def suggest_frequency(self, default=1):
+        """Period to use for seasonal decomposition: that of the column with the strongest cycle, or `default`."""
+        periods, strengths = self.estimate_period()
+        if not np.any(strengths > 0):
+            return default
+        return int(periods[np.nanargmax(strengths)])
 
     def describe(self):
-        """Return descriptive statistics of the time series data."""
-        return {
-            'mean': np.mean(self.data),
-            'median': np.median(self.data),
-            'std_dev': np.std(self.data),
-            'min': np.min(self.data),
-            'max': np.max(self.data),
-            'count': self.data.shape[0]
-        }
-
-    def calculate_trend(self):
-        """Calculate and return the trend using a simple moving average."""
-        window_size = 5
-
-        if self.data.ndim == 1:
-            # Unidimensional: aplicar média móvel diretamente
-            trend = np.convolve(self.data, np.ones(window_size) / window_size, mode='same')
-        else:
-            # Multidimensional: aplicar média móvel em cada coluna
-            trend = np.apply_along_axis(
-                lambda x: np.convolve(x, np.ones(window_size) / window_size, mode='same'),
-                axis=0,
-                arr=self.data
-            )
-        return trend
+        """
+        Return descriptive statistics of the time series data in one pass (see services.describe):
+        scalars for a single series, one value per column otherwise. NaN values are ignored.
+        """
+        # Cópia rasa: quem arredonda os valores para exibir não altera o cache
+        return dict(self._cached('describe', lambda: describe(self.data)))
 
-    def calculate_error(self):
+    def rolling(self, window=5, statistic='mean', center=True, min_periods=None):
         """
-        Calculate the error between the actual values and the adjusted trend using a moving average.
-        Handles both unidimensional and multidimensional data.
+        Rolling mean, median, std, min, max or sum over every column (see services.rolling).
+        Results are cached per set of arguments.
         """
-        trend = self.calculate_trend()
+        return self._cached(('rolling', window, statistic, center, min_periods),
+                            lambda: rolling(self.data, window, statistic, center, min_periods))
 
-        if self.data.ndim == 1:
-            # Garantir que não haja tamanho negativo
-            padding_size = max(0, len(self.data) - len(trend))
-            adjusted_trend = np.concatenate((np.full(padding_size, np.nan), trend))
-        else:
-            # Multidimensional: Ajustar cada coluna separadamente
-            def adjust_trend_for_series(x, trend_series):
-                padding_size = max(0, len(x) - len(trend_series))
-                return np.concatenate((np.full(padding_size, np.nan), trend_series))
-            
-            adjusted_trend = np.apply_along_axis(
-                lambda x: adjust_trend_for_series(x, trend[:, 0]),
-                axis=0,
-                arr=self.data
-            )
-
-        error = self.data - adjusted_trend
-        return error
+    def calculate_trend(self, window_size=5):
+        """
+        Calculate and return the trend using a centered simple moving average.
+        Values outside the series (and NaN gaps) count as zero, like np.convolve(mode='same').
+        """
+        return self._cached(('trend', window_size),
+                            lambda: self.rolling(window_size, 'sum', center=True, min_periods=1) / window_size)
+
+    def calculate_error(self):
+        """Calculate the error between the actual values and the trend, for every column."""
+        return self._cached('error', lambda: self.data - self.calculate_trend())
 
     def calculate_squared_error(self):
         """Calculate the squared error."""
-        return self.calculate_error() ** 2
+        return self._cached('squared_error', lambda: self.calculate_error() ** 2)
 
     def calculate_error_std_dev(self):
-        """Calculate the standard deviation of the error, ignoring NaN values."""
-        error = self.calculate_error()
-        valid_error = error[~np.isnan(error)]
-        return np.std(valid_error)
-
-    def __init__(self, data, timestamps, frequency):
-        self.data = data
-        self.timestamps = timestamps
-        self.frequency = frequency
+        """Calculate the standard deviation of the error of each column, ignoring NaN values."""
+        return self._cached('error_std_dev', lambda: np.nanstd(self.calculate_error(), axis=0))
 
-    def seasonal_decompose(self):
+    @property
+    def error(self):
+        return self.calculate_error()
+
+    @property
+    def squared_error(self):
+        return self.calculate_squared_error()
+
+    @property
+    def error_std_dev(self):
+        return self.calculate_error_std_dev()
+
+    def seasonal_decompose(self, workers=1):
         """Decompose the time series into trend, seasonal, and residual components."""
         if self.data.ndim != 1:
             # Chama o método de decomposição especial se os dados não forem unidimensionais
-            return self.special_decompose()
-        
-        df = pd.DataFrame({'data': self.data}, index=self.timestamps)
-        decomposition = seasonal_decompose(df['data'], model='additive', period=self.frequency)
-        return decomposition.trend, decomposition.seasonal, decomposition.resid
+            return self.special_decompose(workers)
+
+        trend, seasonal, residual = self._decompose(workers)
+        index = pd.Index(self.timestamps)
+        return (
+            pd.Series(trend[:, 0], index=index, name='trend'),
+            pd.Series(seasonal[:, 0], index=index, name='seasonal'),
+            pd.Series(residual[:, 0], index=index, name='resid')
+        )
 
-    def special_decompose(self):
-        """Handle the case where data is multidimensional."""
+    def special_decompose(self, workers=1):
+        """Handle the case where data is multidimensional, decomposing every column in one pass."""
         if self.data.ndim < 2:
             raise ValueError("Data must be at least two-dimensional for special decomposition.")
 
-        trends, seasonals, residuals = [], [], []
-        
-        # Itera sobre cada coluna de dados
-        for i in range(self.data.shape[1]):
-            df = pd.DataFrame({'data': self.data[:, i]}, index=self.timestamps)
-            decomposition = seasonal_decompose(df['data'], model='additive', period=self.frequency)
-            
-            # Renomear as colunas para evitar duplicatas
-            trends.append(decomposition.trend.rename(f'trend_{i}'))
-            seasonals.append(decomposition.seasonal.rename(f'seasonal_{i}'))
-            residuals.append(decomposition.resid.rename(f'residual_{i}'))
-
-        # Converte as listas em arrays numpy
-        return (
-            pd.concat(trends, axis=1),
-            pd.concat(seasonals, axis=1),
-            pd.concat(residuals, axis=1)
-        )
-        
-        # Itera sobre cada coluna de dados
-        for i in range(self.data.shape[1]):
-            df = pd.DataFrame({'data': self.data[:, i]}, index=self.timestamps)
-            decomposition = seasonal_decompose(df['data'], model='additive', period=self.frequency)
-            trends.append(decomposition.trend)
-            seasonals.append(decomposition.seasonal)
-            residuals.append(decomposition.resid)
-
-        # Converte as listas em arrays numpy
+        trend, seasonal, residual = self._decompose(workers)
+        index = pd.Index(self.timestamps)
+        columns = range(self.data.shape[1])
         return (
-            pd.concat(trends, axis=1),
-            pd.concat(seasonals, axis=1),
-            pd.concat(residuals, axis=1)
+            pd.DataFrame(trend, index=index, columns=[f'trend_{i}' for i in columns]),
+            pd.DataFrame(seasonal, index=index, columns=[f'seasonal_{i}' for i in columns]),
+            pd.DataFrame(residual, index=index, columns=[f'residual_{i}' for i in columns])
         )
 
+    def _decompose(self, workers=1):
+        if self.frequency is None:
+            raise ValueError("Frequency must be set for seasonal decomposition.")
+        data = self.data.reshape(self.data.shape[0], -1)
+        return self._cached(('decompose', self.frequency), lambda: decompose(data, self.frequency, workers))
+
     def plot_decompose(self):
         """Plot the seasonal decomposition of the time series data."""
         trend, seasonal, residual = self.seasonal_decompose()
@@ -169,17 +205,49 @@ class TimeSeries:
         plt.tight_layout()
         plt.show()
     
-    def plot(self) :
-        """Plot the time series data."""
+    def plot(self, width=MAX_PLOT_POINTS, start=0, stop=None):
+        """
+        Plot the time series data, or the samples in [start, stop).
+        Longer ranges are reduced to about `width` buckets per column, keeping
+        each bucket's first, last, minimum and maximum points; the min/max
+        pyramid behind it is built once per series and cached.
+        """
         fig = plt.figure(figsize=(10, 5))
-        plt.plot(self.timestamps, self.data, marker='o', linestyle='-')
+        stop = len(self.data) if stop is None else min(stop, len(self.data))
+        if stop - start <= width:
+            plt.plot(self.timestamps[start:stop], self.data[start:stop], marker='o', linestyle='-')
+        else:
+            pyramid = self._cached('pyramid', lambda: MinMaxPyramid(self.data))
+            for column, positions in enumerate(pyramid.query(width, start, stop)):
+                plt.plot(self.timestamps[positions], pyramid.values[positions, column], linestyle='-', color=f'C{column}')
         plt.title('Time Series Plot')
         plt.xlabel('Timestamps')
         plt.ylabel('Values')
         plt.grid(True)
-        plt.show()
         return fig
 
+    def resample(self, interval, aggregation='mean', fill='interpolate', origin=None, frequency=None):
+        """
+        Regular-grid TimeSeries with buckets of width `interval`, aggregated
+        with mean, sum, last or count (see services.resampling). Empty buckets
+        are interpolated by default so the result can be decomposed. Datetime
+        grids start at midnight of the first day unless `origin` is given,
+        matching pandas' resample.
+        """
+        timestamps, values = resample_chunks(array_chunks(self.timestamps, self.data), interval, aggregation, origin, fill)
+        data = values[:, 0] if self.data.ndim == 1 else values
+        return TimeSeries(data, timestamps, frequency or self.frequency)
+
+    @classmethod
+    def from_chunks(cls, chunks, interval, aggregation='mean', fill='interpolate', origin=None, frequency=None):
+        """
+        Create a regular TimeSeries from (timestamps, values) chunks without
+        loading the raw points at once, e.g. array_chunks over memory-mapped
+        arrays or frame_chunks over pd.read_csv(..., chunksize=n).
+        """
+        timestamps, values = resample_chunks(chunks, interval, aggregation, origin, fill)
+        return cls(values[:, 0] if values.shape[1] == 1 else values, timestamps, frequency)
+
     @classmethod
     def from_table(cls, table: Table, time_field: str, value_fields: list[str], frequency: int):
         """Create a TimeSeries instance from a Table object."""
@@ -192,11 +260,8 @@ class TimeSeries:
         if not all([table.column_dict[field].value_type in [ColumnType.Int, ColumnType.Float] for field in value_fields]):
             raise ValueError("Value fields must be numeric to be used in time series.")
         
-        timestamps = np.array(table.column_dict[time_field].values)
-        values = np.array([table.column_dict[field].values for field in value_fields])
-
-        # Verificar se os valores são unidimensionais ou multidimensionais
-        if len(values.shape) == 2:
-            values = values.T  # Transpor se necessário
+        timestamps = table.column_dict[time_field].values
+        # Bloco (amostras x séries) contíguo em float64, sem listas intermediárias
+        values = table.to_array(value_fields)
 
         return cls(timestamps=timestamps, data=values, frequency=frequency)
@@ -0,0 +1,83 @@
+from enum import Enum
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict
+
+class ColumnType(str, Enum):
+    Int = "int"
+    Float = "float"
+    String = "string"
+    Empty = "empty"
+
+# Textos tratados como célula vazia
+NULL_TOKENS = ("", "nan", "na", "n/a", "null", "none")
+# Células conferidas antes de converter a coluna inteira
+SAMPLE_SIZE = 1000
+
+class InferredColumn(BaseModel):
+    """Result of the type inference of a column: its type, converted values and missing cells."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    value_type: ColumnType
+    values: np.ndarray
+    null_mask: np.ndarray
+
+def _no_nulls(values: np.ndarray) -> np.ndarray:
+    # Máscara somente leitura que não ocupa memória
+    return np.broadcast_to(False, values.shape)
+
+def infer_column_type(values: np.ndarray) -> InferredColumn:
+    """
+    Classify a column in a single vectorized pass.
+
+    Numeric arrays are classified from their dtype alone. Text arrays are
+    parsed with pd.to_numeric, so negatives, decimals and exponents are
+    recognized; blank cells and NaN-like tokens are reported in the null
+    mask. Integer columns with missing cells are stored as float64 with NaN.
+    """
+    kind = values.dtype.kind
+    if kind in 'iu':
+        return InferredColumn(value_type=ColumnType.Int, values=values, null_mask=_no_nulls(values))
+    if kind == 'f':
+        null_mask = np.isnan(values)
+        value_type = ColumnType.Empty if null_mask.all() else ColumnType.Float
+        return InferredColumn(value_type=value_type, values=values, null_mask=null_mask)
+    if kind not in 'OSU':
+        return InferredColumn(value_type=ColumnType.String, values=values, null_mask=_no_nulls(values))
+
+    text = pd.Series(values, copy=False).astype(str)
+    # Uma amostra com texto não numérico já decide colunas de texto sem converter tudo
+    if _has_text(text.iloc[:SAMPLE_SIZE]):
+        null_mask = pd.isna(values) | _is_null_token(text)
+        value_type = ColumnType.String if not null_mask.all() else ColumnType.Empty
+        return InferredColumn(value_type=value_type, values=values, null_mask=null_mask)
+
+    # pd.to_numeric ignora espaços nas bordas e devolve int64 quando todos os textos são inteiros
+    numbers = pd.to_numeric(text, errors='coerce')
+    if numbers.dtype.kind in 'iu':
+        return InferredColumn(value_type=ColumnType.Int, values=numbers.to_numpy(dtype=np.int64), null_mask=_no_nulls(values))
+    failed = numbers.isna().to_numpy()
+    if not failed.any():
+        return InferredColumn(value_type=ColumnType.Float, values=numbers.to_numpy(dtype=np.float64), null_mask=_no_nulls(values))
+
+    null_mask = pd.isna(values)
+    null_mask[failed] |= _is_null_token(text[failed])
+    if null_mask.all():
+        return InferredColumn(value_type=ColumnType.Empty, values=values, null_mask=null_mask)
+    if (failed & ~null_mask).any():
+        return InferredColumn(value_type=ColumnType.String, values=values, null_mask=pd.isna(values) | _is_null_token(text))
+    # Com células vazias o resultado é float; confere se os demais textos eram inteiros
+    present = pd.to_numeric(text[~null_mask])
+    value_type = ColumnType.Int if present.dtype.kind in 'iu' else ColumnType.Float
+    return InferredColumn(value_type=value_type, values=numbers.to_numpy(dtype=np.float64), null_mask=null_mask)
+
+def _is_null_token(text: pd.Series) -> np.ndarray:
+    # Normaliza só os valores distintos; o resto é busca em tabela hash
+    uniques = pd.Series(pd.unique(text.to_numpy()))
+    null_uniques = uniques[uniques.str.strip().str.lower().isin(NULL_TOKENS)]
+    return text.isin(null_uniques).to_numpy()
+
+def _has_text(text: pd.Series) -> bool:
+    """Whether any cell is neither a number nor a null token."""
+    failed = pd.to_numeric(text, errors='coerce').isna().to_numpy()
+    return bool(failed.any()) and not _is_null_token(text[failed]).all()
@@ -4,19 +4,12 @@ import seaborn as sns
 import streamlit as st
 from autoviz.AutoViz_Class import AutoViz_Class
 from ydata_profiling import ProfileReport  # Alterado para ydata_profiling
-import re  # Para verificar links nas colunas
-
-
-def contains_link(series):
-    """Verifica se uma série contém links."""
-    url_pattern = r'(http|https|www)\S*'
-    return series.astype(str).apply(lambda x: bool(re.search(url_pattern, x)))
+from .link_detection import filter_columns_with_links as _filter_columns_with_links
 
 
 def filter_columns_with_links(df):
     """Remove colunas que contêm links."""
-    columns_with_links = [col for col in df.columns if contains_link(df[col]).any()]
-    return df.drop(columns=columns_with_links)
+    return _filter_columns_with_links(df)[0]
 
 
 def analyze_data(df):
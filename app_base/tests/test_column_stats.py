@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+from services.column_stats import content_fingerprint
+from services.table_class import Table
+from services.type_inference import ColumnType
+
+def test_date_columns_are_profiled():
+    df = pd.DataFrame({'date': pd.date_range('2024-01-01', periods=5),
+                       'duration': pd.to_timedelta(np.arange(5), 's'),
+                       'value': [1.0, 2.0, 3.0, 4.0, 5.0]})
+    table = Table.from_dataframe(df)
+    profiles = table.profiles()
+    assert profiles['date'].stats.count == 5
+    assert profiles['duration'].stats.mode == '0 days 00:00:00'
+    table.model_dump()
+
+def test_fingerprint_depends_on_inferred_type():
+    values = np.arange(5, dtype=np.float64)
+    assert content_fingerprint(values, ColumnType.Int) != content_fingerprint(values, ColumnType.Float)
+    assert content_fingerprint(values, ColumnType.Float) == content_fingerprint(values.copy(), ColumnType.Float)
@@ -0,0 +1,20 @@
+from pathlib import Path
+import pandas as pd
+import pytest
+from services.data_loading import load_upload
+from services.link_detection import filter_columns_with_links
+from services.table_class import Table
+
+PARSER_DIR = Path(__file__).resolve().parents[1] / "parser"
+
+@pytest.mark.parametrize("path", sorted(PARSER_DIR.glob("*.csv")), ids=lambda path: path.name)
+def test_load_upload_bundled_osdr_csv(path):
+    with open(path, "rb") as uploaded_file:
+        df = load_upload(uploaded_file)
+
+    # Cabeçalhos repetidos (Term Source REF, Unit...) recebem sufixos, como no motor C
+    assert not df.columns.duplicated().any()
+    assert not any(pd.api.types.is_datetime64_any_dtype(dtype) for dtype in df.dtypes)
+    df_filtered, _ = filter_columns_with_links(df)
+    table = Table.from_dataframe(df_filtered)
+    assert len(table.columns) == df_filtered.shape[1]
@@ -0,0 +1,19 @@
+import pandas as pd
+from services.dataset_cache import Dataset, DatasetCache
+from services.table_class import Table
+
+def _dataset(text: str, rows: int = 200) -> Dataset:
+    df = pd.DataFrame({'name': [f'{text} {i}' for i in range(rows)], 'value': range(rows)})
+    return Dataset(df=df, df_filtered=df, columns_with_links=[], table=Table.from_dataframe(df))
+
+def test_nbytes_counts_strings():
+    dataset = _dataset('a long sample description ' * 4)
+    assert dataset.nbytes > dataset.df.memory_usage(deep=False).sum() * 2
+
+def test_max_bytes_evicts_text_heavy_entries():
+    first = _dataset('x' * 1000)
+    cache = DatasetCache(max_entries=8, max_bytes=int(first.nbytes * 1.5))
+    cache.put('first', first)
+    cache.put('second', _dataset('y' * 1000))
+    assert 'first' not in cache and 'second' in cache
+    assert cache.nbytes == cache.get('second').nbytes
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+from statsmodels.tsa.seasonal import seasonal_decompose
+from services.decomposition import decompose
+
+def _series(n: int = 120, columns: int = 3, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    time = np.arange(n)[:, None]
+    return 0.05 * time + np.sin(2 * np.pi * time / 12 + rng.uniform(0, 3, columns)) + rng.normal(scale=0.3, size=(n, columns))
+
+@pytest.mark.parametrize('period', [7, 12])
+def test_matches_statsmodels_for_odd_and_even_periods(period):
+    data = _series()
+    trend, seasonal, residual = decompose(data, period)
+    for column in range(data.shape[1]):
+        expected = seasonal_decompose(data[:, column], model='additive', period=period)
+        np.testing.assert_allclose(trend[:, column], expected.trend)
+        np.testing.assert_allclose(seasonal[:, column], expected.seasonal)
+        np.testing.assert_allclose(residual[:, column], expected.resid)
+
+def test_column_blocks_in_threads_match_one_pass():
+    # Mais colunas que COLUMNS_PER_TASK: a decomposição é dividida em blocos
+    data = _series(columns=150, seed=1)
+    for single, threaded in zip(decompose(data, 12), decompose(data, 12, workers=4)):
+        np.testing.assert_array_equal(single, threaded)
@@ -0,0 +1,45 @@
+import numpy as np
+from services.describe import QuantileSketch, describe, describe_chunks
+from services.time_series import TimeSeries
+
+def _data(seed: int = 0):
+    rng = np.random.default_rng(seed)
+    values = np.c_[rng.normal(size=20_000), rng.exponential(size=20_000)]
+    values[rng.random(values.shape) < 0.05] = np.nan
+    return values
+
+def test_describe_matches_numpy():
+    values = _data()
+    summary = describe(values, quantiles=(0.1, 0.9))
+    np.testing.assert_allclose(summary['mean'], np.nanmean(values, axis=0))
+    np.testing.assert_allclose(summary['std_dev'], np.nanstd(values, axis=0))
+    np.testing.assert_allclose(summary['median'], np.nanmedian(values, axis=0))
+    np.testing.assert_allclose(summary['quantiles'][0.9], np.nanquantile(values, 0.9, axis=0))
+    np.testing.assert_array_equal(summary['count'], (~np.isnan(values)).sum(axis=0))
+
+def test_kll_sketch_rank_error():
+    values = _data(1)
+    sketch = QuantileSketch(k=200, seed=0)
+    halves = [QuantileSketch(k=200, seed=1).update(part) for part in np.array_split(values, 2)]
+    for chunk in np.array_split(values, 37):
+        sketch.update(chunk)
+    merged = halves[0].merge(halves[1])
+    levels = [0.01, 0.25, 0.5, 0.75, 0.99]
+    for estimate in (sketch.quantile(levels), merged.quantile(levels)):
+        for column in range(values.shape[1]):
+            present = np.sort(values[~np.isnan(values[:, column]), column])
+            ranks = np.searchsorted(present, estimate[:, column]) / len(present)
+            assert np.max(np.abs(ranks - levels)) < 0.02
+
+def test_describe_chunks_close_to_exact():
+    values = _data(2)
+    summary = describe_chunks(np.array_split(values, 20))
+    np.testing.assert_allclose(summary['mean'], np.nanmean(values, axis=0))
+    assert np.all(np.abs(summary['median'] - np.nanmedian(values, axis=0)) < 0.05)
+
+def test_time_series_describe_returns_a_copy():
+    series = TimeSeries(np.arange(10.0), np.arange(10))
+    summary = series.describe()
+    summary['mean'] = round(summary['mean'])
+    summary['extra'] = 1
+    assert series.describe() == describe(np.arange(10.0))
@@ -0,0 +1,43 @@
+import numpy as np
+from services.downsampling import MinMaxPyramid, m4_downsample
+
+def _walk(n: int = 5000, columns: int = 2, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    data = rng.normal(size=(n, columns)).cumsum(axis=0)
+    data[rng.random(data.shape) < 0.01] = np.nan
+    return data
+
+def test_levels_hold_the_extremes_of_every_bucket():
+    data = _walk(1000)
+    pyramid = MinMaxPyramid(data)
+    for level, (argmin, argmax) in enumerate(pyramid.levels):
+        size = 1 << level
+        for bucket in range(-(-len(data) // size)):
+            chunk = data[bucket * size:(bucket + 1) * size]
+            if np.isnan(chunk).all(axis=0).any():
+                continue
+            np.testing.assert_array_equal(data[argmin[bucket], [0, 1]], np.nanmin(chunk, axis=0))
+            np.testing.assert_array_equal(data[argmax[bucket], [0, 1]], np.nanmax(chunk, axis=0))
+
+def test_query_keeps_the_envelope_of_the_range():
+    data = _walk()
+    pyramid = MinMaxPyramid(data)
+    for width, start, stop in ((100, 0, None), (64, 123, 4321), (10, 777, 901)):
+        stop_index = len(data) if stop is None else stop
+        for column, positions in enumerate(pyramid.query(width, start, stop)):
+            assert positions[0] == start and positions[-1] == stop_index - 1
+            assert len(positions) <= 4 * width + 2 * np.log2(len(data)) + 2
+            window = data[start:stop_index, column]
+            assert np.nanmin(data[positions, column]) == np.nanmin(window)
+            assert np.nanmax(data[positions, column]) == np.nanmax(window)
+
+def test_m4_keeps_first_last_min_and_max_of_each_bucket():
+    y = _walk(3000, 1, seed=1)[:, 0]
+    x = np.arange(len(y))
+    kept_x, kept_y = m4_downsample(x, y, 50)
+    buckets = x * 50 // len(y)
+    for bucket in range(50):
+        members = x[buckets == bucket]
+        expected = {members[0], members[-1], members[np.nanargmin(y[members])], members[np.nanargmax(y[members])]}
+        assert expected <= set(kept_x[buckets[kept_x] == bucket])
+    np.testing.assert_array_equal(kept_y, y[kept_x])
@@ -0,0 +1,66 @@
+from itertools import combinations
+import numpy as np
+import pytest
+from services.feature_selection import select_features
+from services.multiple_linear_regression import MultipleLinearRegression
+from services.regression_fit import information_criterion
+
+def _data(n: int = 80, p: int = 7, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, p))
+    X[:, 4] += 0.7 * X[:, 1]
+    Y = X[:, [0, 1, 4]] @ rng.normal(size=(3, 2)) + rng.normal(size=(n, 2))
+    return X, Y
+
+def _rss(X, Y, subset) -> np.ndarray:
+    # Ajuste de referência do zero, com intercepto
+    design = np.hstack((np.ones((len(X), 1)), X[:, list(subset)]))
+    coefficients = np.linalg.lstsq(design, Y, rcond=None)[0]
+    return ((Y - design @ coefficients) ** 2).sum(axis=0)
+
+def _criterion(X, Y, subset, criterion) -> float:
+    return information_criterion(_rss(X, Y, subset), len(X), len(subset) + 1, criterion).sum()
+
+@pytest.mark.parametrize('criterion', ['aic', 'bic'])
+def test_forward_steps_match_refits(criterion):
+    X, Y = _data()
+    selection = select_features(X, Y, 'forward', criterion, workers=2)
+    chosen = []
+    for _, row in selection.steps.iloc[1:].iterrows():
+        candidates = [column for column in range(X.shape[1]) if column not in chosen]
+        best = min(candidates, key=lambda column: _criterion(X, Y, chosen + [column], criterion))
+        chosen.append(best)
+        assert row['column'] == best
+        np.testing.assert_allclose(row['rss'], _rss(X, Y, chosen).sum())
+        np.testing.assert_allclose(row[criterion], _criterion(X, Y, chosen, criterion))
+    assert selection.selected == chosen[:int(selection.steps[criterion].argmin())]
+
+def test_backward_steps_match_refits():
+    X, Y = _data(seed=1)
+    selection = select_features(X, Y, 'backward', 'aic')
+    remaining = list(range(X.shape[1]))
+    for _, row in selection.steps.iloc[1:].iterrows():
+        worst = min(remaining, key=lambda column: _criterion(X, Y, [c for c in remaining if c != column], 'aic'))
+        remaining.remove(worst)
+        assert row['column'] == worst
+        np.testing.assert_allclose(row['aic'], _criterion(X, Y, remaining, 'aic'))
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_best_subset_matches_brute_force(executor):
+    X, Y = _data(seed=2)
+    selection = select_features(X, Y, 'best_subset', 'bic', max_features=4, workers=2, executor=executor)
+    for size in range(1, 5):
+        expected = min(combinations(range(X.shape[1]), size), key=lambda subset: _criterion(X, Y, subset, 'bic'))
+        row = selection.steps.iloc[size]
+        assert row['column'] == list(expected)
+        np.testing.assert_allclose(row['bic'], _criterion(X, Y, expected, 'bic'))
+    best = int(selection.steps['bic'].argmin())
+    assert selection.selected == ([] if best == 0 else selection.steps['column'][best])
+
+def test_fit_selected_narrows_the_model():
+    X, Y = _data(seed=3)
+    model = MultipleLinearRegression(X, Y)
+    model.columns_x = [f'x{i}' for i in range(X.shape[1])]
+    model.fit_selected('forward', 'aic')
+    assert model.columns_x == [f'x{i}' for i in model.selection.selected]
+    np.testing.assert_allclose(model.result.rss, _rss(X, Y, model.selection.selected))
@@ -0,0 +1,64 @@
+import numpy as np
+from scipy.linalg import solve_toeplitz
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+from services.forecasting import AutoRegressive, HoltWinters
+
+def _seasonal(n: int = 96, columns: int = 2, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    time = np.arange(n)[:, None]
+    return 10 + 0.1 * time + 2 * np.sin(2 * np.pi * time / 12) + rng.normal(scale=0.3, size=(n, columns))
+
+def _ar2(n: int = 500, columns: int = 2, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    noise = rng.normal(size=(n, columns))
+    values = np.zeros((n, columns))
+    for t in range(2, n):
+        values[t] = 0.6 * values[t - 1] - 0.3 * values[t - 2] + noise[t]
+    return values + 0.01 * np.arange(n)[:, None]
+
+def test_holt_winters_matches_statsmodels_for_fixed_parameters():
+    data = _seasonal()
+    model = HoltWinters(12, alphas=(0.4,), betas=(0.2,), gammas=(0.3,)).fit(data)
+    level, trend, season = model._initial_state(data)
+    for column in range(data.shape[1]):
+        # Mesmo estado inicial: só a recursão é comparada
+        expected = ExponentialSmoothing(
+            data[:, column], trend='add', seasonal='add', seasonal_periods=12, initialization_method='known',
+            initial_level=level[column], initial_trend=trend[column], initial_seasonal=season[:, column]
+        ).fit(smoothing_level=0.4, smoothing_trend=0.2, smoothing_seasonal=0.3, optimized=False)
+        np.testing.assert_allclose(model.forecast(10)[:, column], expected.forecast(10))
+        np.testing.assert_allclose(model.mse[column], expected.sse / len(data))
+
+def test_holt_winters_grid_keeps_the_best_combination_per_column():
+    data = _seasonal(seed=1)
+    grid = HoltWinters(12, alphas=(0.2, 0.6), betas=(0.05, 0.3), gammas=(0.1, 0.5)).fit(data)
+    for column in range(data.shape[1]):
+        single = [HoltWinters(12, alphas=(a,), betas=(b,), gammas=(g,)).fit(data[:, column])
+                  for a in (0.2, 0.6) for b in (0.05, 0.3) for g in (0.1, 0.5)]
+        best = min(single, key=lambda model: model.mse[0])
+        np.testing.assert_allclose(grid.params[column], best.params[0])
+        np.testing.assert_allclose(grid.forecast(5)[:, column], best.forecast(5)[:, 0])
+
+def test_ar_coefficients_match_yule_walker():
+    data = _ar2()
+    model = AutoRegressive(order=3).fit(data)
+    time = np.arange(len(data))
+    for column in range(data.shape[1]):
+        detrended = data[:, column] - np.polyval(np.polyfit(time, data[:, column], 1), time)
+        # Equações de Yule-Walker com a autocovariância enviesada, calculada direto
+        covariances = np.array([detrended[:len(detrended) - lag] @ detrended[lag:] for lag in range(4)])
+        expected = solve_toeplitz(covariances[:3], covariances[1:])
+        np.testing.assert_allclose(model.coefficients[column], expected, atol=1e-12)
+
+def test_ar_forecast_follows_the_recursion():
+    data = _ar2(seed=1)
+    model = AutoRegressive().fit(data)
+    for column, order in enumerate(model.order):
+        assert order >= 2 and not model.coefficients[column, order:].any()
+    time = np.arange(len(data) + 4)
+    line = model.intercept + model.slope * time[:, None]
+    residuals = list(data - line[:len(data)])
+    for _ in range(4):
+        recent = np.array(residuals[-model.max_order:][::-1])
+        residuals.append(np.einsum('mj,jm->m', model.coefficients, recent))
+    np.testing.assert_allclose(model.forecast(4), line[len(data):] + np.array(residuals[len(data):]))
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+from services.linear_solvers import QR_BLOCK_ROWS, SOLVERS, solve_least_squares
+from services.multiple_linear_regression import MultipleLinearRegression
+
+def _problem(n: int, p: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, p)) * rng.uniform(0.1, 10, p)
+    return X, X @ rng.normal(size=(p, 3)) + rng.normal(size=(n, 3))
+
+@pytest.mark.parametrize("method", SOLVERS)
+@pytest.mark.parametrize("n", [200, 2 * QR_BLOCK_ROWS + 100])
+def test_solvers_match_lstsq(method, n):
+    X, Y = _problem(n, 8)
+    expected = np.linalg.lstsq(X, Y, rcond=None)[0]
+    np.testing.assert_allclose(solve_least_squares(X, Y, method).coefficients, expected, rtol=1e-8, atol=1e-10)
+
+@pytest.mark.parametrize("method", SOLVERS)
+def test_rank_deficient_design_gets_minimum_norm_solution(method):
+    X, Y = _problem(100, 6, seed=4)
+    X = np.c_[X, X[:, 0]]
+    solution = solve_least_squares(X, Y, method)
+    assert solution.rank == 6
+    np.testing.assert_allclose(solution.coefficients, np.linalg.pinv(X) @ Y, rtol=1e-6, atol=1e-8)
+
+def test_cholesky_on_duplicated_column_keeps_standard_errors_finite():
+    rng = np.random.default_rng(4)
+    X = rng.normal(size=(100, 6))
+    model = MultipleLinearRegression(np.c_[X, X[:, 0]], rng.normal(size=(100, 2)))
+    model.fit(method='cholesky')
+    assert model.solution.rank == 7
+    assert np.nanmax(model.result.std_errors) < 1.0
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+from services.periodicity import autocorrelation, estimate_period, periodogram
+
+def _period(series):
+    return estimate_period(*periodogram(series), autocorrelation(series))
+
+def test_long_noisy_period_is_not_taken_for_a_short_lag():
+    rng = np.random.default_rng(0)
+    t = np.arange(500)
+    series = np.sin(2 * np.pi * t / 50) + 0.5 * rng.normal(size=len(t))
+    periods, strengths = _period(series)
+    assert abs(periods[0] - 50) <= 2
+    assert strengths[0] > 0
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_long_sinusoids(seed):
+    rng = np.random.default_rng(seed)
+    period, n = rng.uniform(20, 120), int(rng.integers(300, 2000))
+    t = np.arange(n)
+    series = rng.uniform(0.5, 3) * np.sin(2 * np.pi * t / period + rng.uniform(0, 6)) + rng.normal(size=n)
+    periods, _ = _period(series)
+    assert abs(periods[0] - period) <= 0.1 * period
+
+def test_harmonic_stronger_than_fundamental():
+    rng = np.random.default_rng(1)
+    t = np.arange(1200)
+    series = 0.6 * np.sin(2 * np.pi * t / 30) + np.sin(4 * np.pi * t / 30 + 1) + 0.3 * rng.normal(size=len(t))
+    periods, _ = _period(series)
+    assert periods[0] == 30
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+import statsmodels.api as sm
+from services.multiple_linear_regression import MultipleLinearRegression
+from services.resampling import array_chunks
+
+def _data(n: int = 150, p: int = 4, k: int = 2, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, p))
+    Y = 1.0 + X @ rng.normal(size=(p, k)) + rng.normal(scale=2.0, size=(n, k))
+    return X, Y
+
+@pytest.mark.parametrize('method', ['qr', 'cholesky'])
+def test_diagnostics_match_statsmodels_ols(method):
+    X, Y = _data()
+    model = MultipleLinearRegression(X, Y)
+    model.fit(method)
+    result = model.result
+    for response in range(Y.shape[1]):
+        expected = sm.OLS(Y[:, response], sm.add_constant(X)).fit()
+        np.testing.assert_allclose(result.coefficients[:, response], expected.params)
+        np.testing.assert_allclose(result.std_errors[:, response], expected.bse)
+        np.testing.assert_allclose(result.t_values[:, response], expected.tvalues)
+        np.testing.assert_allclose(result.p_values[:, response], expected.pvalues)
+        np.testing.assert_allclose(result.r_squared[response], expected.rsquared)
+        np.testing.assert_allclose(result.adjusted_r_squared[response], expected.rsquared_adj)
+        np.testing.assert_allclose(result.residuals[:, response], expected.resid)
+        # statsmodels soma a constante n * (1 + log 2π) da verossimilhança gaussiana
+        constant = len(X) * (1 + np.log(2 * np.pi))
+        np.testing.assert_allclose(result.aic[response] + constant, expected.aic)
+        np.testing.assert_allclose(result.bic[response] + constant, expected.bic)
+
+def test_streamed_statistics_give_the_same_diagnostics():
+    X, Y = _data(seed=1)
+    model = MultipleLinearRegression(X, Y)
+    model.fit()
+    streamed = MultipleLinearRegression.fit_streaming(array_chunks(X, Y, chunk_rows=32)).result
+    for name in ('coefficients', 'std_errors', 'p_values', 'r_squared', 'adjusted_r_squared', 'aic'):
+        np.testing.assert_allclose(getattr(streamed, name), getattr(model.result, name))
+    assert streamed.residuals is None
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from services.multiple_linear_regression import MultipleLinearRegression
+from services.regularization import _standardize, cross_validate, elastic_net_path, ridge_path
+
+def _data(n: int = 120, p: int = 8, k: int = 2, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, p)) * rng.uniform(0.5, 5, p) + rng.normal(size=p)
+    X[:, 1] += 0.8 * X[:, 0]
+    weights = np.zeros((p, k))
+    weights[:3] = rng.normal(size=(3, k))
+    return X, 2.0 + X @ weights + rng.normal(size=(n, k))
+
+def test_ridge_matches_closed_form():
+    X, Y = _data()
+    path = ridge_path(X, Y)
+    Xs, Ys, mean_x, mean_y, scale = _standardize(X, Y)
+    n, p = Xs.shape
+    for alpha, coefficients, intercept in zip(path.alphas, path.coefficients, path.intercepts):
+        expected = np.linalg.solve(Xs.T @ Xs + n * alpha * np.eye(p), Xs.T @ Ys) / scale[:, None]
+        np.testing.assert_allclose(coefficients, expected, rtol=1e-8, atol=1e-12)
+        np.testing.assert_allclose(intercept, mean_y - mean_x @ expected)
+
+@pytest.mark.parametrize('l1_ratio', [1.0, 0.5])
+def test_elastic_net_satisfies_kkt_conditions(l1_ratio):
+    X, Y = _data(seed=1)
+    path = elastic_net_path(X, Y, l1_ratio)
+    Xs, Ys, _, _, scale = _standardize(X, Y)
+    n = len(Xs)
+    # Folga da tolerância de parada da descida por coordenadas
+    slack = 1e-6 * np.abs(Xs.T @ Ys).max() / n
+    assert not path.coefficients[0].any()
+    for alpha, coefficients in zip(path.alphas, path.coefficients):
+        standardized = coefficients * scale[:, None]
+        gradient = Xs.T @ (Ys - Xs @ standardized) / n - alpha * (1 - l1_ratio) * standardized
+        active = standardized != 0
+        np.testing.assert_allclose(gradient[active], alpha * l1_ratio * np.sign(standardized[active]), atol=slack)
+        assert np.all(np.abs(gradient[~active]) <= alpha * l1_ratio + slack)
+
+def test_cross_validation_in_threads_matches_serial():
+    X, Y = _data(seed=2)
+    serial = cross_validate(X, Y, 1.0, folds=4, workers=1)
+    threaded = cross_validate(X, Y, 1.0, folds=4, workers=2, executor="thread")
+    np.testing.assert_allclose(threaded.fold_errors, serial.fold_errors)
+    np.testing.assert_array_equal(threaded.best_alpha, serial.best_alpha)
+
+def test_fit_regularized_keeps_the_path_coefficients():
+    X, Y = _data(seed=3)
+    model = MultipleLinearRegression(X, Y)
+    model.fit_regularized('lasso', folds=3, workers=1)
+    best = model.cross_validation.best_index
+    np.testing.assert_allclose(model.coefficients, model.path.coefficients[best, :, np.arange(Y.shape[1])].T)
+    np.testing.assert_allclose(model.intercept, model.path.intercepts[best, np.arange(Y.shape[1])])
+    np.testing.assert_array_equal(model.alpha, model.cross_validation.best_alpha)
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+from services.resampling import Resampler
+
+def _points(seed: int = 0, n: int = 600):
+    rng = np.random.default_rng(seed)
+    # Poucos timestamps distintos: muitos empates, espalhados entre os blocos
+    timestamps = pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 60, n), 'min')
+    values = rng.normal(size=(n, 2))
+    values[rng.random(values.shape) < 0.2] = np.nan
+    return timestamps.to_numpy(), values
+
+def _expected(timestamps, values):
+    return pd.DataFrame(values, index=timestamps).resample('10min').last().to_numpy()
+
+def test_last_breaks_timestamp_ties_by_row_order():
+    timestamps, values = _points()
+    resampler = Resampler('10min')
+    for start in range(0, len(timestamps), 100):
+        resampler.update(timestamps[start:start + 100], values[start:start + 100])
+    np.testing.assert_array_equal(resampler.result('last'), _expected(timestamps, values))
+
+def test_last_with_chunks_out_of_row_order():
+    timestamps, values = _points(seed=1)
+    resampler = Resampler('10min')
+    for start in (300, 0, 500, 100, 400, 200):
+        resampler.update(timestamps[start:start + 100], values[start:start + 100], first_row=start)
+    np.testing.assert_array_equal(resampler.result('last'), _expected(timestamps, values))
+
+def test_default_origin_matches_pandas_start_day():
+    rng = np.random.default_rng(2)
+    timestamps = pd.Timestamp('2024-01-02 03:05') + pd.to_timedelta(np.sort(rng.integers(0, 600, 300)), 'min')
+    values = rng.normal(size=(300, 1))
+    resampler = Resampler('7min').update(timestamps.to_numpy(), values)
+    expected = pd.DataFrame(values, index=timestamps).resample('7min').mean()
+    np.testing.assert_array_equal(resampler.timestamps, expected.index.to_numpy())
+    np.testing.assert_allclose(resampler.result('mean'), expected.to_numpy())
@@ -0,0 +1,25 @@
+import warnings
+import numpy as np
+import pandas as pd
+import pytest
+from services.rolling import STATISTICS, rolling
+
+def _data(seed: int = 0):
+    rng = np.random.default_rng(seed)
+    values = 1e6 + rng.normal(size=(300, 3))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    return values
+
+@pytest.mark.parametrize("statistic", STATISTICS)
+@pytest.mark.parametrize("center", [True, False])
+def test_rolling_matches_pandas(statistic, center):
+    values = _data()
+    expected = getattr(pd.DataFrame(values).rolling(7, center=center, min_periods=3), statistic)().to_numpy()
+    np.testing.assert_allclose(rolling(values, 7, statistic, center, min_periods=3), expected, rtol=1e-7, atol=1e-7)
+
+def test_all_nan_column_std_emits_no_warning():
+    values = np.c_[np.full(20, np.nan), np.arange(20.0)]
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = rolling(values, 5, 'std')
+    assert np.isnan(result[:, 0]).all()
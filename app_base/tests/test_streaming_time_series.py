@@ -0,0 +1,40 @@
+import numpy as np
+from services.decomposition import decompose
+from services.describe import describe
+from services.streaming_time_series import StreamingTimeSeries
+
+def _stream(data: np.ndarray, chunk_sizes, **options) -> StreamingTimeSeries:
+    stream = StreamingTimeSeries(n_series=data.shape[1], **options)
+    start = 0
+    for size in chunk_sizes:
+        stream.append(np.arange(start, start + size), data[start:start + size])
+        start += size
+    return stream
+
+def _series(n: int = 200, columns: int = 2, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    time = np.arange(n)[:, None]
+    return 0.02 * time + np.cos(2 * np.pi * time / 8) + rng.normal(scale=0.2, size=(n, columns))
+
+def test_decomposition_in_chunks_matches_batch():
+    data = _series()
+    stream = _stream(data, [1, 5, 30, 3, 61, 100], capacity=500, frequency=8)
+    for streamed, batch in zip(stream.seasonal_decompose(), decompose(data, 8)):
+        np.testing.assert_allclose(streamed, batch, atol=1e-12)
+
+def test_seasonal_profile_covers_points_past_the_capacity():
+    # O perfil sazonal soma todo o histórico, não só os pontos no buffer
+    data = _series(seed=1)
+    stream = _stream(data, [40] * 5, capacity=50, frequency=8)
+    np.testing.assert_allclose(stream.seasonal_profile(), decompose(data, 8)[1][:8], atol=1e-12)
+    np.testing.assert_array_equal(stream.data, data[-50:])
+
+def test_trend_and_describe_match_batch():
+    data = _series(seed=2)
+    stream = _stream(data, [7] * 20 + [60], capacity=500, window=5)
+    trailing = np.vstack([data[max(0, i - 4):i + 1].mean(axis=0) for i in range(len(data))])
+    np.testing.assert_allclose(stream.trend, trailing)
+    streamed, batch = stream.describe(), describe(data)
+    for name in ('mean', 'std_dev', 'min', 'max'):
+        np.testing.assert_allclose(streamed[name], batch[name])
+    assert streamed['count'] == len(data)
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+from services.table_class import Table
+from services.time_series import TimeSeries
+
+def _frame(n: int = 200, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({'time': np.arange(n), 'x': rng.normal(size=n), 'count': rng.integers(0, 9, n),
+                          'label': rng.choice(['a', 'b'], n), 'y': rng.normal(size=n)})
+    frame.loc[rng.random(n) < 0.1, 'y'] = np.nan
+    return frame
+
+def test_to_array_matches_pandas():
+    frame = _frame()
+    table = Table.from_dataframe(frame)
+    fields = ['y', 'count', 'x']
+    block = table.to_array(fields)
+    np.testing.assert_array_equal(block, frame[fields].to_numpy(dtype=np.float64))
+    assert block.dtype == np.float64 and block.flags.c_contiguous
+
+def test_single_float_column_is_a_read_only_view():
+    frame = _frame()
+    block = Table.from_dataframe(frame).to_array(['x'])
+    assert np.shares_memory(block, frame['x'].to_numpy())
+    assert not block.flags.writeable
+
+def test_to_array_rejects_text_and_unknown_columns():
+    table = Table.from_dataframe(_frame())
+    with pytest.raises(ValueError):
+        table.to_array(['x', 'label'])
+    with pytest.raises(ValueError):
+        table.to_array(['missing'])
+
+def test_from_table_uses_the_same_block():
+    frame = _frame()
+    series = TimeSeries.from_table(Table.from_dataframe(frame), 'time', ['x', 'y'], frequency=7)
+    np.testing.assert_array_equal(series.data, frame[['x', 'y']].to_numpy())
+    np.testing.assert_array_equal(series.timestamps, frame['time'].to_numpy())
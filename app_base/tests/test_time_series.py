@@ -0,0 +1,15 @@
+import numpy as np
+from services.time_series import TimeSeries
+
+def _series(n: int = 120) -> TimeSeries:
+    t = np.arange(n)
+    return TimeSeries(10 + 0.1 * t + np.sin(2 * np.pi * t / 12), t, frequency=12)
+
+def test_forecast_with_list_valued_grid_reuses_the_fit():
+    series = _series()
+    first = series.forecast(3, 'holt_winters', alphas=[0.2, 0.5], gammas=np.array([0.1, 0.3]))
+    model = series.fit_forecaster('holt_winters', alphas=[0.2, 0.5], gammas=np.array([0.1, 0.3]))
+    second = series.forecast(6, 'holt_winters', alphas=(0.2, 0.5), gammas=[0.1, 0.3])
+    assert series.fit_forecaster('holt_winters', alphas=[0.2, 0.5], gammas=[0.1, 0.3]) is model
+    assert len(series._cache) == 1
+    np.testing.assert_allclose(second[:3], first)